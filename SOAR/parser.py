@@ -4,21 +4,37 @@ import asyncio
 import aiohttp # pip로 설치해야 사용가능.
 from typing import Dict, Any, List
 
-class CalderaClient: 
+# 프로세스 전역 세션 풀: 같은 서버/키 조합이면 DNS/TCP 핸드셰이크를 재사용
+_SESSIONS: Dict[tuple, aiohttp.ClientSession] = {}
+
+class CalderaClient:
     def __init__(self, base_url: str, api_key: str = None):
-        
+
         self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
         self.headers = {'KEY': api_key} if api_key else {}
         self.session = None
 
     async def _ensure_session(self):
-        if self.session is None or self.session.closed:
-            connector = aiohttp.TCPConnector(ssl=False) 
-            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector)
-        
+        key = (self.base_url, self.api_key)
+        session = _SESSIONS.get(key)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(ssl=False, limit=100, ttl_dns_cache=300)
+            session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+            _SESSIONS[key] = session
+        self.session = session
+
     async def close(self):
-        if self.session and not self.session.closed:
-            await self.session.close()
+        # 공유 세션은 닫지 않고 참조만 해제 (프로세스 종료 시 shutdown() 호출)
+        self.session = None
+
+    @classmethod
+    async def shutdown(cls):
+        # aiohttp on_cleanup 등에서 한 번 호출해 공유 세션을 일괄 정리
+        for session in _SESSIONS.values():
+            if not session.closed:
+                await session.close()
+        _SESSIONS.clear()
 
     async def get_operation_by_id(self, op_id: str) -> Dict[str, Any]:
         await self._ensure_session()
@@ -43,15 +59,22 @@ class CalderaClient:
         execution_chain = operation_data.get('chain', [])
 
         for link in execution_chain:
-            ability = getattr(link, 'ability', {})
-            
+            # REST 응답의 link는 dict이므로 getattr 대신 .get 한 번으로 접근
+            # (객체 체인일 때만 getattr로 폴백)
+            if isinstance(link, dict):
+                link_get = link.get
+            else:
+                link_get = link.__dict__.get
+
+            ability = link_get('ability') or {}
+
             technique_id = ability.get('technique_id') if isinstance(ability, dict) else None
             ability_name = ability.get('name') if isinstance(ability, dict) else 'N/A'
-            
-            timestamp = getattr(link, 'finish', None) or getattr(link, 'start', None) or getattr(link, 'decide', None)
-            
-            command_executed = getattr(link, 'command', 'Unknown Command')
-            
+
+            timestamp = link_get('finish') or link_get('start') or link_get('decide')
+
+            command_executed = link_get('command', 'Unknown Command')
+
             if technique_id:
                 context.append({
                     'technique_id': technique_id,
@@ -76,6 +99,7 @@ async def main():
             print(item)
     
     await client.close()
+    await CalderaClient.shutdown()
 
 # if __name__ == '__main__':
 #     asyncio.run(main())
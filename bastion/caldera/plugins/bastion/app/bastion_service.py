@@ -4,23 +4,161 @@ BASTION 서비스 - Caldera와 Wazuh 통합 핵심 로직
 
 import aiohttp
 import asyncio
+import contextlib
+import functools
 import logging
 import json
+import random
+import re
+import string
+import sys
+import time
+import traceback
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 from aiohttp import web
 from dateutil import parser as date_parser
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+if orjson is not None:
+    def _json_dumps(obj) -> str:
+        """orjson 기반 직렬화 (stdlib json 대비 수 배 빠름)"""
+        return orjson.dumps(obj).decode('utf-8')
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> str:
+        """stdlib fallback - 공백 없는 compact 직렬화"""
+        return json.dumps(obj, separators=(',', ':'))
+
+    _json_loads = json.loads
+
+
+# 이 크기(바이트) 이상의 응답 본문은 이벤트 루프를 막지 않도록 executor에서 파싱
+_LARGE_BODY_THRESHOLD = 1 << 20
+
+# json= 대신 data=_json_dumps(...)로 보낼 때 쓰는 공용 헤더
+# (aiohttp의 stdlib json 인코딩 경로를 우회해 orjson으로 직렬화)
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+async def _read_json(resp):
+    """aiohttp 응답 본문을 JSON으로 파싱 (큰 본문은 executor로 넘김)"""
+    raw = await resp.read()
+    if len(raw) >= _LARGE_BODY_THRESHOLD:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, _json_loads, raw)
+    return _json_loads(raw)
+
 # loading integration_engine
 
 try:
     from .integration_engine import IntegrationEngine
 except Exception as e:
-    import logging
     logging.getLogger('bastion').warning(f'[BASTION] IntegrationEngine 로컬 import 실패, fallback 사용: {e}')
     from importlib import import_module
     IntegrationEngine = import_module('integration_engine').IntegrationEngine
 
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_utc_naive(value: str):
+    """ISO8601 문자열 -> naive UTC datetime (실패 시 None, 'Z' 접미사 허용)
+
+    작전/링크 타임스탬프는 요청마다 반복 파싱되므로 lru_cache로 재사용한다.
+    """
+    s = value[:-1] + '+00:00' if value.endswith('Z') else value
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        return None
+    return dt.replace(tzinfo=None)
+
+
+# MITRE 기법 ID 형식 (T1059 / T1059.004) - 모듈 로드 시 한 번만 컴파일
+_TID_RE = re.compile(r'^T\d{4}(?:\.\d{3})?$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_tid(value: str):
+    """기법 ID 정규화: strip + 대문자화, 'TECHNIQUE/' 접두 제거
+
+    알림 수천 건에 걸쳐 같은 기법 ID(T1059 등)가 반복되므로 lru_cache로
+    정규화 결과를 재사용한다. 'T로 시작하면 통과' 휴리스틱 대신 컴파일된
+    _TID_RE로 검증해 T1059.004 같은 서브기법은 살리고 쓰레기 값은 걸러낸다.
+    sys.intern으로 동일 ID가 단일 str 객체를 공유하게 해서 set 연산이
+    해시 대신 포인터 비교로 끝나게 한다.
+    """
+    s = value.strip().upper()
+    if s.startswith('TECHNIQUE/'):
+        s = s[len('TECHNIQUE/'):]
+    return sys.intern(s) if _TID_RE.match(s) else None
+
+
+# ASCII 전용 소문자 변환 테이블 (유니코드 casefold 경로 우회)
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+@functools.lru_cache(maxsize=1024)
+def _norm_name_str(s: str) -> str:
+    """strip + 소문자 정규화 (str 전용, lru_cache 적용 지점)"""
+    s = s.strip()
+    if s.isascii():
+        return s.translate(_ASCII_LOWER)
+    return s.lower()
+
+
+def _norm_name(value) -> str:
+    """agent/호스트명 소문자 정규화
+
+    실제 환경의 호스트명은 ASCII이므로 translate 고속 경로를 타고,
+    아닌 경우에만 유니코드 lower()로 처리한다. 수천 건의 알림에
+    등장하는 호스트명은 수십 개뿐이므로 결과를 lru_cache로 재사용한다.
+    """
+    return _norm_name_str(value) if isinstance(value, str) else ''
+
+
+@functools.lru_cache(maxsize=2048)
+def _sorted_techniques(fs: frozenset) -> tuple:
+    """기법 ID 집합 -> 정렬된 tuple
+
+    폴링 요청마다 같은 기법 집합이 반복 직렬화되므로 frozenset 키로
+    정렬 결과를 캐싱해 동일 집합은 tuple 하나를 공유한다.
+    """
+    return tuple(sorted(fs))
+
+
+# 1초 단위로 캐싱되는 UTC ISO 타임스탬프 (응답 메타데이터용)
+_NOW_CACHE = [0.0, '']
+
+
+def _utc_now_iso() -> str:
+    """UTC ISO 문자열 반환 - 같은 초 안의 호출은 포매팅을 생략하고 캐시 재사용
+
+    query_time/timestamp 같은 응답 메타 필드에만 사용한다 (정밀도: 1초).
+    """
+    t = time.time()
+    if t - _NOW_CACHE[0] >= 1.0:
+        _NOW_CACHE[0] = t
+        _NOW_CACHE[1] = datetime.utcfromtimestamp(t).isoformat()
+    return _NOW_CACHE[1]
+
+
+def _naive_utc(dt):
+    """timezone-aware datetime -> naive datetime (이미 naive거나 datetime이 아니면 그대로)
+
+    핸들러 곳곳에서 반복되던 `x.replace(tzinfo=None) if x.tzinfo else x` 패턴을 공용화.
+    """
+    if isinstance(dt, datetime) and dt.tzinfo:
+        return dt.replace(tzinfo=None)
+    return dt
+
+
 class BASTIONService:
     """Caldera-Wazuh 통합 서비스"""
 
@@ -28,6 +166,43 @@ class BASTIONService:
     TIMEOUT_HEALTH = 5      # Health check (빠른 응답 필요)
     TIMEOUT_AUTH = 10       # 인증 및 짧은 API 호출
     TIMEOUT_QUERY = 30      # 데이터 조회 및 복잡한 쿼리
+    TIMEOUT_ES = 20         # Discover용 Elasticsearch 호출
+
+    # 대시보드 탐지 이벤트 수집 상한 - search_after 페이지네이션으로
+    # 1000건 단위 페이지를 이 값까지 이어 붙인다 (메모리 보호용)
+    DASHBOARD_ALERT_LIMIT = 5000
+
+    # 알림 조회 엔드포인트의 limit 파라미터 상한
+    ALERTS_FETCH_LIMIT = 2000
+
+    # 동시에 실행할 correlate() 코루틴 상한 (인덱서 과부하 방지)
+    MAX_CONCURRENT_CORRELATE = 16
+
+    # 커버리지 응답 캐시 TTL (초) - 대시보드가 수 초 간격으로 폴링하므로
+    # 동일 파라미터 요청은 짧게 캐싱해서 Wazuh 재쿼리를 줄인다
+    COVERAGE_CACHE_TTL = 5
+    # 커버리지 캐시 엔트리 상한 - hours는 사용자 입력이므로 상한 없이 쌓이면 안 됨
+    COVERAGE_CACHE_MAX = 64
+
+    # 알림 조회 결과 캐시 TTL (초) - 대시보드 폴링 주기의 중복 조회 흡수
+    ALERTS_CACHE_TTL = 30
+    # 알림 캐시 엔트리 상한 - 파라미터 조합당 최대 2000건짜리 payload가 실리므로
+    # 작게 잡는다 (hours/min_level/limit은 사용자 입력)
+    ALERTS_CACHE_MAX = 32
+
+    # 필수 Wazuh 연결 설정 키 - 기동 시점에 한 번만 검사 (요청 경로에서 재검사 금지)
+    _REQUIRED_CONFIG_KEYS = ('wazuh_manager_url', 'wazuh_indexer_url',
+                             'wazuh_username', 'wazuh_password')
+
+    # 링크 ability에서 응답으로 내보내는 필드 목록 (entry dict 빌드용)
+    _ABILITY_FIELDS = ('ability_id', 'name', 'tactic', 'technique_id', 'technique_name')
+
+    # health_check 응답의 고정 골격 (요청마다 키 리터럴 재구성 방지)
+    _HEALTH_TEMPLATE = {
+        'plugin': 'healthy',
+        'wazuh_manager': 'unknown',
+        'wazuh_indexer': 'unknown',
+    }
 
     # Wazuh Rule ID → MITRE ATT&CK Technique 매핑
     # Wazuh 기본 규칙에 MITRE 태그가 없으므로 수동 매핑
@@ -200,7 +375,13 @@ class BASTIONService:
         self.knowledge_svc = services.get('knowledge_svc')
         self.log = self.app_svc.log if self.app_svc else logging.getLogger('bastion')
 
-        # Wazuh 설정
+        # Wazuh 설정 (빠진 필수 키는 기동 시 한 번만 경고하고 기본값으로 진행)
+        missing_key = next(
+            (k for k in self._REQUIRED_CONFIG_KEYS if not config.get(k)), None
+        )
+        if missing_key:
+            self.log.warning(f'[BASTION] 설정 누락: {missing_key} (기본값 사용)')
+
         self.manager_url = config.get('wazuh_manager_url', 'https://localhost:55000')
         self.indexer_url = config.get('wazuh_indexer_url', 'https://localhost:9200')
         self.username = config.get('wazuh_username', 'wazuh')
@@ -213,20 +394,26 @@ class BASTIONService:
         self.elastic_password = config.get('elastic_password', 'changeme')
         self.verify_ssl = config.get('verify_ssl', False)
         self.monitor_interval = config.get('alert_query_interval', 300)
+
+        # 설정은 프로세스 수명 동안 불변이므로 인증 객체는 한 번만 생성해서 재사용
+        self.manager_auth = aiohttp.BasicAuth(self.username, self.password)
+        self.indexer_auth = aiohttp.BasicAuth(self.indexer_username, self.indexer_password)
+        self.elastic_auth = aiohttp.BasicAuth(self.elastic_username, self.elastic_password)
         #  IntegrationEngine 초기화
+        # overrides는 지연 재초기화(_get_engine)에서 재사용하므로 보관
+        self._engine_overrides = config.get("integration_engine") or {}
+        self._engine_retry_after = 0.0
         try:
             self.log.info("[BASTION] IntegrationEngine 초기화 시작...")
-            overrides = config.get("integration_engine") or {}
-            self.log.info(f"[BASTION] IntegrationEngine overrides: {overrides}")
+            self.log.info(f"[BASTION] IntegrationEngine overrides: {self._engine_overrides}")
             # RULE_MITRE_MAPPING을 IntegrationEngine에 전달
-            self.integration_engine = IntegrationEngine(overrides, rule_mitre_mapping=self.RULE_MITRE_MAPPING)
+            self.integration_engine = IntegrationEngine(self._engine_overrides, rule_mitre_mapping=self.RULE_MITRE_MAPPING)
             self.log.info("[BASTION] IntegrationEngine 초기화 완료 ✓")
             self.log.info(f"[BASTION] IntegrationEngine client type: {type(self.integration_engine.client).__name__}")
             self.log.info(f"[BASTION] Rule-MITRE 매핑: {len(self.RULE_MITRE_MAPPING)}개 규칙")
         except Exception as e:
             self.integration_engine = None
             self.log.error(f"[BASTION] IntegrationEngine 초기화 실패: {e}")
-            import traceback
             traceback.print_exc()
 
         # 상태 관리
@@ -235,22 +422,93 @@ class BASTIONService:
         self.last_alert_time = datetime.utcnow()
         self.is_authenticated = False
 
-        
+        # 커버리지 응답 TTL 캐시 (LRU): key -> (monotonic timestamp, payload)
+        self._coverage_cache: OrderedDict = OrderedDict()
+        # 알림 조회 캐시 (LRU): (hours, min_level, limit, indexer_url) -> (monotonic, payload)
+        self._alerts_cache: OrderedDict = OrderedDict()
+        # 진행 중인 알림 조회 (single-flight): key -> Future
+        self._alerts_inflight: Dict[tuple, asyncio.Future] = {}
+        # 진행 중인 커버리지 계산 (single-flight): key -> Future
+        self._coverage_inflight: Dict[tuple, asyncio.Future] = {}
+
+        # Wazuh Manager/Indexer 공유 ClientSession (지연 생성)
+        self._session: Optional[aiohttp.ClientSession] = None
+        # 동시 재인증 coalescing용 락
+        self._auth_lock = asyncio.Lock()
+        # Discover용 Elasticsearch 공유 ClientSession (지연 생성)
+        self._es_session: Optional[aiohttp.ClientSession] = None
+
+        # correlate 팬아웃 상한 - 작전 수가 많아도 인덱서에 동시에 때리는
+        # 검색 수를 제한해 429/커넥션 고갈을 방지
+        self._correlate_sem = asyncio.Semaphore(self.MAX_CONCURRENT_CORRELATE)
+
+    def _get_engine(self):
+        """IntegrationEngine 접근자 - 초기화 실패 시 지연 재시도
+
+        엔진(과 그 안의 커넥션 풀)은 프로세스 수명 동안 하나만 만들어
+        재사용한다. 부팅 시점에 인덱서가 아직 안 떠서 초기화가 실패했던
+        경우를 위해 60초 간격으로만 재생성을 시도한다 (요청마다 재구성해
+        풀을 버리는 일이 없도록).
+        """
+        if self.integration_engine is None:
+            now = time.monotonic()
+            if now >= self._engine_retry_after:
+                self._engine_retry_after = now + 60
+                try:
+                    self.integration_engine = IntegrationEngine(
+                        self._engine_overrides, rule_mitre_mapping=self.RULE_MITRE_MAPPING)
+                    self.log.info('[BASTION] IntegrationEngine 지연 초기화 성공')
+                except Exception as e:
+                    self.log.warning(f'[BASTION] IntegrationEngine 재초기화 실패: {e}')
+        return self.integration_engine
+
+    async def _bounded_correlate(self, op):
+        """세마포어로 동시성을 제한한 correlate 래퍼 (gather 팬아웃용)"""
+        async with self._correlate_sem:
+            return await self.integration_engine.correlate(op)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Wazuh Manager/Indexer 공유 ClientSession 반환 (지연 생성)
+
+        요청마다 세션을 새로 만들면 매번 TCP+TLS 핸드셰이크가 발생하므로
+        keepalive 커넥션 풀(limit=100)을 가진 세션 하나를 프로세스 수명
+        동안 재사용한다. 더 짧은 타임아웃이 필요한 호출은 요청 시점에
+        timeout= 인자로 개별 지정한다.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT_QUERY),
+                connector=aiohttp.TCPConnector(
+                    ssl=self.verify_ssl, limit=100, ttl_dns_cache=300))
+        return self._session
+
+    @contextlib.asynccontextmanager
+    async def _wazuh_session(self):
+        """공유 세션을 async with 블록으로 쓰기 위한 래퍼 (블록 종료 시 닫지 않음)"""
+        yield await self._get_session()
+
+    async def close(self):
+        """공유 세션 정리 (플러그인 종료 시 호출)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self._es_session is not None and not self._es_session.closed:
+            await self._es_session.close()
 
     async def authenticate(self):
         """Wazuh Manager API 인증"""
         try:
-            auth = aiohttp.BasicAuth(self.username, self.password)
+            auth = self.manager_auth
             url = f'{self.manager_url}/security/user/authenticate?raw=true'
+            timeout = aiohttp.ClientTimeout(total=self.TIMEOUT_AUTH)
 
-            timeout = aiohttp.ClientTimeout(total=10)
-            connector = aiohttp.TCPConnector(ssl=self.verify_ssl)
-
-            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-                async with session.post(url, auth=auth) as resp:
+            async with self._wazuh_session() as session:
+                async with session.post(url, auth=auth, timeout=timeout) as resp:
                     if resp.status == 200:
                         self.token = await resp.text()
-                        self.token_expiry = datetime.utcnow() + timedelta(minutes=15)
+                        # 만료를 14분 + 지터로 잡아 실제 만료(15분)보다 먼저,
+                        # 그러나 동시 다발로는 갱신되지 않게 한다
+                        self.token_expiry = datetime.utcnow() + timedelta(
+                            minutes=14, seconds=random.uniform(0, 60))
                         self.is_authenticated = True
                         self.log.info('[BASTION] Wazuh API 인증 성공')
                         return True
@@ -272,26 +530,37 @@ class BASTIONService:
     # -----------------------------
     # Elasticsearch (Discover 용)
     # -----------------------------
+    @contextlib.asynccontextmanager
+    async def _elastic_session(self):
+        """
+        Discover 핸들러 공통 전처리 - Wazuh 쪽과 마찬가지로 세션 하나를
+        지연 생성해 keepalive 풀을 재사용한다 (블록 종료 시 닫지 않음)
+        """
+        if self._es_session is None or self._es_session.closed:
+            self._es_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT_ES),
+                connector=aiohttp.TCPConnector(
+                    ssl=self.verify_ssl, limit=100, ttl_dns_cache=300))
+        yield self._es_session
+
     async def get_es_indices(self, request: web.Request) -> web.Response:
         """
         Elasticsearch 인덱스 목록 반환 (Discover용)
         """
         try:
-            timeout = aiohttp.ClientTimeout(total=15)
-            connector = aiohttp.TCPConnector(ssl=self.verify_ssl)
-            auth = aiohttp.BasicAuth(self.elastic_username, self.elastic_password)
+            auth = self.elastic_auth
             url = f'{self.elastic_url}/_cat/indices?format=json&h=index'
 
-            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            async with self._elastic_session() as session:
                 async with session.get(url, auth=auth) as resp:
                     if resp.status != 200:
                         text = await resp.text()
                         raise Exception(f'ES indices 호출 실패 (HTTP {resp.status}): {text}')
-                    data = await resp.json()
+                    data = await _read_json(resp)
                     indices = [item.get('index') for item in data if item.get('index')]
                     # 중복 제거 + 정렬
                     unique = sorted(set(indices))
-                    return web.json_response(unique)
+                    return web.json_response(unique, dumps=_json_dumps)
         except Exception as e:
             self.log.error(f'[BASTION] ES 인덱스 조회 실패: {e}')
             return web.json_response({'error': str(e)}, status=500)
@@ -317,34 +586,35 @@ class BASTIONService:
                 ]
             }
 
-            timeout = aiohttp.ClientTimeout(total=20)
-            connector = aiohttp.TCPConnector(ssl=self.verify_ssl)
-            auth = aiohttp.BasicAuth(self.elastic_username, self.elastic_password)
+            auth = self.elastic_auth
             url = f'{self.elastic_url}/{index}/_search'
 
-            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            async with self._elastic_session() as session:
                 async with session.post(url, auth=auth, json=body) as resp:
                     if resp.status != 200:
                         text = await resp.text()
                         raise Exception(f'ES search 실패 (HTTP {resp.status}): {text}')
-                    data = await resp.json()
+                    data = await _read_json(resp)
                     hits = data.get('hits', {}).get('hits', [])
+                    # 히트당 바이트코드 최소화: bound method 호이스팅 + dict 자체를
+                    # update에 넘겨 keys() 뷰 생성 생략 (200건 핫루프)
                     rows = []
+                    rows_append = rows.append
                     columns = set()
+                    columns_update = columns.update
                     for hit in hits:
-                        source = hit.get('_source', {}) or {}
-                        doc_id = hit.get('_id')
-                        if doc_id:
+                        source = hit.get('_source') or {}
+                        if doc_id := hit.get('_id'):
                             source['id'] = doc_id
-                        rows.append(source)
-                        columns.update(source.keys())
-                    columns = sorted(list(columns))
+                        rows_append(source)
+                        columns_update(source)
+                    columns = sorted(columns)
                     result = {
                         'total': data.get('hits', {}).get('total', {}).get('value', len(rows)),
                         'columns': columns,
                         'rows': rows
                     }
-                    return web.json_response(result)
+                    return web.json_response(result, dumps=_json_dumps)
         except Exception as e:
             self.log.error(f'[BASTION] ES 검색 실패: {e}')
             return web.json_response({'error': str(e)}, status=500)
@@ -365,8 +635,9 @@ class BASTIONService:
             })
 
         # 시간 범위 (@timestamp 기준)
-        time_from = (time_range or {}).get('from')
-        time_to = (time_range or {}).get('to')
+        time_range = time_range or {}
+        time_from = time_range.get('from')
+        time_to = time_range.get('to')
         if time_from or time_to:
             range_query = {'range': {'@timestamp': {}}}
             if time_from:
@@ -402,11 +673,9 @@ class BASTIONService:
     async def get_discover_indices(self, request: web.Request) -> web.Response:
         """GET /api/discover/indices - Elasticsearch _cat/indices"""
         try:
-            timeout = aiohttp.ClientTimeout(total=15)
-            connector = aiohttp.TCPConnector(ssl=self.verify_ssl)
-            auth = aiohttp.BasicAuth(self.elastic_username, self.elastic_password)
+            auth = self.elastic_auth
             url = f'{self.elastic_url}/_cat/indices?format=json'
-            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            async with self._elastic_session() as session:
                 async with session.get(url, auth=auth) as resp:
                     text = await resp.text()
                     if resp.status == 401:
@@ -418,7 +687,7 @@ class BASTIONService:
                     except Exception:
                         data = []
                     indices = [item.get('index') for item in data if item.get('index')]
-                    return web.json_response(indices)
+                    return web.json_response(indices, dumps=_json_dumps)
         except (asyncio.TimeoutError, aiohttp.ClientError) as e:
             self.log.error(f'[Discover] 인덱스 조회 타임아웃/클라이언트 오류: {e}')
             return web.json_response({'error': 'Elasticsearch 요청 실패'}, status=504)
@@ -468,19 +737,28 @@ class BASTIONService:
             if offset > 0:
                 body['from'] = offset
 
-            timeout = aiohttp.ClientTimeout(total=20)
-            connector = aiohttp.TCPConnector(ssl=self.verify_ssl)
-            auth = aiohttp.BasicAuth(self.elastic_username, self.elastic_password)
+            # UI가 표시할 컬럼을 알려주면 _source를 그 필드들로 투영해
+            # 응답 바이트와 파싱 비용을 줄인다 (미지정 시 전체 _source)
+            columns_filter = payload.get('columns')
+            if isinstance(columns_filter, list) and columns_filter:
+                body['_source'] = columns_filter
+
+            # filter_path로 응답 envelope(_shards, _score 등) 제거
+            search_params = {
+                'filter_path': 'took,hits.total,hits.hits._source,hits.hits._id'
+            }
+
+            auth = self.elastic_auth
             search_url = f'{self.elastic_url}/{index}/_search'
             field_caps_url = f'{self.elastic_url}/{index}/_field_caps?fields=*'
 
             # Collect field names from field_caps for complete schema coverage
             fields_from_caps = set()
-            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            async with self._elastic_session() as session:
                 try:
                     async with session.get(field_caps_url, auth=auth) as resp:
                         if resp.status == 200:
-                            caps_data = await resp.json()
+                            caps_data = await _read_json(resp)
                             fields_dict = caps_data.get('fields', {}) or {}
                             fields_from_caps.update(fields_dict.keys())
                         else:
@@ -488,14 +766,17 @@ class BASTIONService:
                 except Exception as caps_err:
                     self.log.warning(f'[Discover] field_caps fetch failed: {caps_err}')
 
-                async with session.post(search_url, auth=auth, json=body) as resp:
-                    text = await resp.text()
+                async with session.post(search_url, auth=auth, json=body,
+                                        params=search_params) as resp:
                     if resp.status == 401:
                         return web.json_response({'error': 'Elasticsearch 인증 실패'}, status=401)
                     if resp.status != 200:
+                        text = await resp.text()
                         raise Exception(f'ES search 실패 (HTTP {resp.status}): {text}')
+                    # 대용량 응답 디코딩은 _read_json이 executor로 우회시켜
+                    # 이벤트 루프가 다른 Discover 요청을 계속 처리할 수 있게 한다
                     try:
-                        data = json.loads(text)
+                        data = await _read_json(resp)
                     except Exception:
                         data = {}
                     hits = data.get('hits', {}).get('hits', [])
@@ -520,13 +801,14 @@ class BASTIONService:
                                     keys.extend(flatten_keys(item, prefix))
                         return keys
 
+                    rows_append = rows.append
+                    columns_update = columns.update
                     for hit in hits:
-                        source = hit.get('_source', {}) or {}
-                        doc_id = hit.get('_id')
-                        if doc_id:
+                        source = hit.get('_source') or {}
+                        if doc_id := hit.get('_id'):
                             source['id'] = doc_id
-                        rows.append(source)
-                        columns.update(flatten_keys(source))
+                        rows_append(source)
+                        columns_update(flatten_keys(source))
 
                     used_fields = set(columns)
                     all_fields = fields_from_caps or used_fields
@@ -543,7 +825,7 @@ class BASTIONService:
                         },
                         'rows': rows
                     }
-                    return web.json_response(result)
+                    return web.json_response(result, dumps=_json_dumps)
         except (asyncio.TimeoutError, aiohttp.ClientError) as e:
             self.log.error(f'[Discover] 검색 타임아웃/클라이언트 오류: {e}')
             return web.json_response({'error': 'Elasticsearch 요청 실패'}, status=504)
@@ -552,13 +834,72 @@ class BASTIONService:
             return web.json_response({'error': str(e)}, status=500)
 
     async def _ensure_authenticated(self):
-        """토큰 유효성 확인 및 재인증"""
-        if not self.token or not self.token_expiry:
-            await self.authenticate()
-        elif datetime.utcnow() >= self.token_expiry:
-            self.log.info('[BASTION] 토큰 만료, 재인증 중...')
+        """토큰 유효성 확인 및 재인증 (동시 호출은 인증 1회를 공유)"""
+        if self.token and self.token_expiry and datetime.utcnow() < self.token_expiry:
+            return
+        async with self._auth_lock:
+            # 락 대기 중 다른 코루틴이 이미 갱신했을 수 있으므로 재확인
+            if self.token and self.token_expiry and datetime.utcnow() < self.token_expiry:
+                return
+            if self.token:
+                self.log.info('[BASTION] 토큰 만료, 재인증 중...')
             await self.authenticate()
 
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: tuple, ttl: float):
+        """TTL 검사가 포함된 LRU 캐시 조회 (만료 엔트리는 그 자리에서 제거)"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if (time.monotonic() - entry[0]) >= ttl:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: tuple, payload, max_entries: int) -> None:
+        """LRU 캐시에 저장하고 상한 초과분은 오래된 엔트리부터 축출"""
+        cache[key] = (time.monotonic(), payload)
+        cache.move_to_end(key)
+        while len(cache) > max_entries:
+            cache.popitem(last=False)
+
+    @classmethod
+    def _extract_technique(cls, source: dict) -> Optional[str]:
+        """알림 _source에서 MITRE technique ID 추출 (공용 헬퍼)
+
+        rule.mitre.id → data.mitre.id → RULE_MITRE_MAPPING 순서로 찾고
+        배열이면 첫 값을 쓴다. 반환값은 _norm_tid로 정규화된 ID 또는 None.
+        """
+        rule = source.get('rule') or {}
+        technique_id = None
+
+        mitre = rule.get('mitre')
+        if isinstance(mitre, dict):
+            ids = mitre.get('id')
+            if isinstance(ids, list) and ids:
+                technique_id = ids[0]
+            elif isinstance(ids, str):
+                technique_id = ids
+
+        if not technique_id:
+            data = source.get('data')
+            mitre = data.get('mitre') if isinstance(data, dict) else None
+            if isinstance(mitre, dict):
+                ids = mitre.get('id')
+                if isinstance(ids, list) and ids:
+                    technique_id = ids[0]
+                elif isinstance(ids, str):
+                    technique_id = ids
+
+        if not technique_id:
+            technique_id = cls.RULE_MITRE_MAPPING.get(str(rule.get('id', '')))
+
+        if technique_id:
+            return _norm_tid(str(technique_id))
+        return None
+
     async def get_recent_alerts(self, request: web.Request) -> web.Response:
         """
         최근 Wazuh 알림 조회
@@ -566,14 +907,38 @@ class BASTIONService:
         Query Parameters:
             hours: 조회 시간 범위 (기본: 1시간)
             min_level: 최소 심각도 레벨 (기본: 7)
+            limit: 최대 조회 건수 (기본: 100, 상한: 2000)
         """
+        cache_key = None
+        future = None
         try:
             hours = int(request.query.get('hours', 1))
             min_level = int(request.query.get('min_level', 7))
+            limit = min(int(request.query.get('limit', 100)), self.ALERTS_FETCH_LIMIT)
+
+            # 동일 파라미터 폴링은 TTL 내에서 캐시된 결과 재사용
+            cache_key = (hours, min_level, limit, self.indexer_url)
+            cached = self._cache_get(self._alerts_cache, cache_key, self.ALERTS_CACHE_TTL)
+            if cached is not None:
+                return web.json_response(cached, dumps=_json_dumps)
+
+            # single-flight: 동일 파라미터 조회가 이미 진행 중이면 그 결과를 공유
+            inflight = self._alerts_inflight.get(cache_key)
+            if inflight is not None:
+                payload = await asyncio.shield(inflight)
+                if payload is None:
+                    return web.json_response({
+                        'success': False,
+                        'error': 'alerts query failed'
+                    }, status=500)
+                return web.json_response(payload, dumps=_json_dumps)
+
+            future = asyncio.get_event_loop().create_future()
+            self._alerts_inflight[cache_key] = future
 
             self.log.info(f'[BASTION] 알림 조회 요청: 최근 {hours}시간, 레벨 >= {min_level}')
 
-            # OpenSearch 쿼리
+            # OpenSearch 쿼리 (search_after 페이지네이션용 _id tie-breaker 포함)
             query = {
                 "query": {
                     "bool": {
@@ -583,8 +948,12 @@ class BASTIONService:
                         ]
                     }
                 },
-                "size": 100,
-                "sort": [{"timestamp": {"order": "desc"}}],
+                "size": min(limit, 100),
+                "sort": [
+                    {"timestamp": {"order": "desc"}},
+                    {"_id": {"order": "desc"}}
+                ],
+                "track_total_hits": False,
                 "_source": [
                 "@timestamp","timestamp",
                 "rule.id", "rule.level", "rule.description",
@@ -594,73 +963,71 @@ class BASTIONService:
                 ]
             }
 
-            timeout = aiohttp.ClientTimeout(total=30)
-            connector = aiohttp.TCPConnector(ssl=self.verify_ssl)
-
-            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            # size 단발 쿼리 대신 search_after로 페이지를 이어 붙여 limit까지 수집
+            # (단일 응답 크기를 한 페이지로 묶어 피크 메모리도 줄어든다)
+            page_size = query['size']
+            alerts = []
+            async with self._wazuh_session() as session:
                 # Wazuh Indexer 인증
-                auth = aiohttp.BasicAuth(self.indexer_username, self.indexer_password)
-                async with session.post(
-                    f'{self.indexer_url}/wazuh-alerts-*/_search',
-                    json=query,
-                    auth=auth
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        alerts = data.get('hits', {}).get('hits', [])
-
-                        # MITRE 기법 추출 및 각 alert에 technique_id 추가
-                        techniques = set()
-                        processed_alerts = []
+                auth = self.indexer_auth
+                search_url = f'{self.indexer_url}/wazuh-alerts-*/_search'
+                while len(alerts) < limit:
+                    async with session.post(search_url, data=_json_dumps(query),
+                                            headers=_JSON_HEADERS, auth=auth) as resp:
+                        if resp.status != 200:
+                            error_text = await resp.text()
+                            self.log.error(f'[BASTION] Indexer 쿼리 실패: {error_text}')
+                            if not alerts:
+                                return web.json_response({
+                                    'success': False,
+                                    'error': f'Indexer query failed: HTTP {resp.status}'
+                                }, status=500)
+                            break
+                        data = await _read_json(resp)
+                    page = data.get('hits', {}).get('hits', [])
+                    if not page:
+                        break
+                    alerts.extend(page)
+                    if len(page) < page_size:
+                        break
+                    last_sort = page[-1].get('sort')
+                    if not last_sort:
+                        break
+                    query['search_after'] = last_sort
+            del alerts[limit:]
+
+            # MITRE 기법 추출 및 각 alert에 technique_id 추가
+            techniques = set()
+            processed_alerts = []
+            extract_technique = self._extract_technique
+
+            for alert in alerts:
+                source = alert.get('_source', {})
+
+                technique_id = extract_technique(source)
+                if technique_id:
+                    techniques.add(technique_id)
+
+                # 각 alert에 매핑된 technique_id 추가 (프론트엔드 표시용)
+                # source는 JSON 디코드 직후의 dict라 재사용처가 없으므로
+                # 복사 없이 제자리에서 주석을 단다 (알림당 dict 할당 1회 절약)
+                source['technique_id'] = technique_id
+                processed_alerts.append(source)
 
-                        for alert in alerts:
-                            source = alert.get('_source', {})
-                            
-
-                            # 1. 먼저 알림에서 직접 MITRE 데이터 확인
-                            # rule.mitre.id 필드에서 기술 ID 추출
-                            rule_data = source.get('rule', {})
-                            mitre_data = rule_data.get('mitre', {})
-                            technique_id = None
-
-                            if isinstance(mitre_data, dict) and 'id' in mitre_data:
-                                # mitre.id는 배열일 수 있으므로 첫 번째 값 사용
-                                mitre_ids = mitre_data['id']
-                                if isinstance(mitre_ids, list) and len(mitre_ids) > 0:
-                                    technique_id = mitre_ids[0]
-                                elif isinstance(mitre_ids, str):
-                                    technique_id = mitre_ids
-
-                            # 2. MITRE 데이터가 없으면 규칙 ID 매핑 테이블 사용
-                            if not technique_id:
-                                rule_id = str(rule_data.get('id', ''))
-                                technique_id = self.RULE_MITRE_MAPPING.get(rule_id)
-
-                            if technique_id:
-                                techniques.add(technique_id)
-
-                            # 각 alert에 매핑된 technique_id 추가 (프론트엔드 표시용)
-                            alert_data = source.copy()
-                            alert_data['technique_id'] = technique_id
-                            processed_alerts.append(alert_data)
-
-                        result = {
-                            'success': True,
-                            'total': len(alerts),
-                            'alerts': processed_alerts,
-                            'detected_techniques': list(techniques),
-                            'query_time': datetime.utcnow().isoformat()
-                        }
+            result = {
+                'success': True,
+                'total': len(alerts),
+                'alerts': processed_alerts,
+                'detected_techniques': list(_sorted_techniques(frozenset(techniques))),
+                'query_time': _utc_now_iso()
+            }
 
-                        self.log.info(f'[BASTION] 알림 {len(alerts)}건 조회 완료')
-                        return web.json_response(result)
-                    else:
-                        error_text = await resp.text()
-                        self.log.error(f'[BASTION] Indexer 쿼리 실패: {error_text}')
-                        return web.json_response({
-                            'success': False,
-                            'error': f'Indexer query failed: HTTP {resp.status}'
-                        }, status=500)
+            self.log.info(f'[BASTION] 알림 {len(alerts)}건 조회 완료')
+            self._cache_put(self._alerts_cache, cache_key, result, self.ALERTS_CACHE_MAX)
+            if not future.done():
+                future.set_result(result)
+            # 대용량 응답이므로 stdlib json 대신 orjson 경로로 직렬화
+            return web.json_response(result, dumps=_json_dumps)
 
         except Exception as e:
             self.log.error(f'[BASTION] 알림 조회 실패: {e}', exc_info=True)
@@ -668,6 +1035,12 @@ class BASTIONService:
                 'success': False,
                 'error': str(e)
             }, status=500)
+        finally:
+            # 실패 포함 어떤 경로로든 inflight 등록 해제 (대기자는 None을 실패로 처리)
+            if future is not None:
+                self._alerts_inflight.pop(cache_key, None)
+                if not future.done():
+                    future.set_result(None)
 
     async def correlate_operation(self, request: web.Request) -> web.Response:
         """
@@ -675,12 +1048,18 @@ class BASTIONService:
         (IntegrationEngine 기반으로 operation ↔ detection 매칭)
         """
         try:
-            if not hasattr(self, 'integration_engine') or self.integration_engine is None:
+            if self._get_engine() is None:
                 return web.json_response({
                     'success': False,
                     'error': 'IntegrationEngine not initialized'
                 }, status=500)
 
+            if self.data_svc is None:
+                return web.json_response({
+                    'success': False,
+                    'error': 'data_svc unavailable'
+                }, status=503)
+
             data = await request.json()
             operation_id = data.get('operation_id')
 
@@ -701,17 +1080,8 @@ class BASTIONService:
             operation = operations[0]
 
             # 2) 작전 실행 시간 범위 계산 (안전한 timezone 처리)
-            start_time = operation.start
-            if start_time:
-                if hasattr(start_time, 'tzinfo') and start_time.tzinfo:
-                    start_time = start_time.replace(tzinfo=None)
-            else:
-                start_time = datetime.utcnow()
-
-            end_time = operation.finish if operation.finish else datetime.utcnow()
-            if end_time:
-                if hasattr(end_time, 'tzinfo') and end_time.tzinfo:
-                    end_time = end_time.replace(tzinfo=None)
+            start_time = _naive_utc(operation.start) or datetime.utcnow()
+            end_time = _naive_utc(operation.finish) if operation.finish else datetime.utcnow()
 
             try:
                 duration_seconds = int((end_time - start_time).total_seconds())
@@ -729,13 +1099,7 @@ class BASTIONService:
                     if not ability:
                         continue
 
-                    ability_data = {
-                        'ability_id': getattr(ability, 'ability_id', ''),
-                        'name': getattr(ability, 'name', ''),
-                        'tactic': getattr(ability, 'tactic', ''),
-                        'technique_id': getattr(ability, 'technique_id', ''),
-                        'technique_name': getattr(ability, 'technique_name', '')
-                    }
+                    ability_data = {field: getattr(ability, field, '') for field in self._ABILITY_FIELDS}
                     executed_abilities.append(ability_data)
 
                     if ability_data.get('technique_id'):
@@ -779,39 +1143,47 @@ class BASTIONService:
             #   ]
             # }
 
-            # 5) 탐지된 Technique / 매칭된 alert 리스트 계산 (안전한 처리)
-            detected_techniques = set()
+            # 5) 탐지된 Technique 집합은 단일 set comprehension으로 계산
+            detected_techniques = {
+                lr.get('technique_id') for lr in link_results
+                if lr.get('technique_id') and lr.get('detected')
+            }
+
+            # 매칭된 alert 리스트 계산
+            # match dict는 _summarize_hit이 만든 고정 구조라 .get만 쓰면
+            # 예외가 날 수 없으므로 알림당 try/except는 두지 않는다
             alerts_matched = []
+            alerts_matched_extend = alerts_matched.extend
 
             for lr in link_results:
                 try:
-                    tech = lr.get('technique_id')
-                    if tech and lr.get('detected'):
-                        detected_techniques.add(tech)
+                    matches = lr.get('matches')
+                    if not matches:
+                        continue
 
+                    tech = lr.get('technique_id')
                     link_id = lr.get('link_id', '')
                     ability_name = lr.get('ability_name', '')
 
-                    for m in lr.get('matches', []):
-                        try:
-                            alerts_matched.append({
-                                # Vue 테이블에서 쓰기 좋은 형태로 필드명 정리
-                                'timestamp': m.get('@timestamp') or m.get('timestamp'),
-                                'rule_id': m.get('rule.id') or m.get('rule_id'),
-                                'rule_level': m.get('level') or m.get('rule_level'),
-                                'description': m.get('description', ''),
-                                'agent_name': m.get('agent.name') or m.get('agent_name'),
-                                'agent_id': m.get('agent.id') or m.get('agent_id'),
-                                'technique_id': tech or m.get('mitre.id') or m.get('technique_id'),
-                                # 어느 링크/ability에서 나온 탐지인지도 같이 제공
-                                'link_id': link_id,
-                                'ability_name': ability_name,
-                                'match_status': 'MATCHED',
-                                'match_source': 'wazuh'
-                            })
-                        except Exception as alert_err:
-                            self.log.debug(f'[BASTION] 알림 처리 중 에러 (skip): {alert_err}')
-                            continue
+                    # 링크당 컴프리헨션 1회로 extend (match마다 append 디스패치 생략)
+                    alerts_matched_extend([
+                        {
+                            # Vue 테이블에서 쓰기 좋은 형태로 필드명 정리
+                            'timestamp': m.get('@timestamp') or m.get('timestamp'),
+                            'rule_id': m.get('rule.id') or m.get('rule_id'),
+                            'rule_level': m.get('level') or m.get('rule_level'),
+                            'description': m.get('description', ''),
+                            'agent_name': m.get('agent.name') or m.get('agent_name'),
+                            'agent_id': m.get('agent.id') or m.get('agent_id'),
+                            'technique_id': tech or m.get('mitre.id') or m.get('technique_id'),
+                            # 어느 링크/ability에서 나온 탐지인지도 같이 제공
+                            'link_id': link_id,
+                            'ability_name': ability_name,
+                            'match_status': 'MATCHED',
+                            'match_source': 'wazuh'
+                        }
+                        for m in matches
+                    ])
                 except Exception as lr_err:
                     self.log.debug(f'[BASTION] link_result 처리 중 에러 (skip): {lr_err}')
                     continue
@@ -824,6 +1196,12 @@ class BASTIONService:
             if operation_techniques:
                 detection_rate = len(matched_techniques) / len(operation_techniques)
 
+            # 응답용 리스트는 정렬 한 번에서 파생 (겹치는 set 4개를 따로 정렬하지 않음)
+            sorted_op = sorted(operation_techniques)
+            sorted_matched = [t for t in sorted_op if t in detected_techniques]
+            sorted_undetected = [t for t in sorted_op if t not in detected_techniques]
+            sorted_detected = list(_sorted_techniques(frozenset(detected_techniques)))
+
             # 7) 최종 상관관계 결과 생성 (기존 response schema 유지 + links 추가)
             correlation_result = {
                 'success': True,
@@ -837,10 +1215,10 @@ class BASTIONService:
                     'total_techniques': len(operation_techniques),
                     'detected_techniques': len(matched_techniques),
                     'undetected_techniques': len(undetected_techniques),
-                    'matched_techniques': list(matched_techniques),
-                    'undetected_techniques_list': list(undetected_techniques),
-                    'all_operation_techniques': list(operation_techniques),
-                    'all_detected_techniques': list(detected_techniques)
+                    'matched_techniques': sorted_matched,
+                    'undetected_techniques_list': sorted_undetected,
+                    'all_operation_techniques': sorted_op,
+                    'all_detected_techniques': sorted_detected
                 },
                 'executed_abilities': executed_abilities,
                 # 🔹 link별 raw 결과도 내려주면 프론트에서 더 디테일하게 쓸 수 있음
@@ -855,7 +1233,7 @@ class BASTIONService:
                 f'탐지율 {detection_rate:.1%}, links={len(link_results)}, alerts={len(alerts_matched)}'
             )
 
-            return web.json_response(correlation_result)
+            return web.json_response(correlation_result, dumps=_json_dumps)
 
         except Exception as e:
             self.log.error(f'[BASTION] 상관관계 분석 실패: {e}', exc_info=True)
@@ -876,7 +1254,7 @@ class BASTIONService:
                 'detection_rate': 0.0
             }
 
-            return web.json_response(report)
+            return web.json_response(report, dumps=_json_dumps)
 
         except Exception as e:
             self.log.error(f'[BASTION] 리포트 생성 실패: {e}', exc_info=True)
@@ -912,6 +1290,12 @@ class BASTIONService:
             search: 검색어 (선택사항)
         """
         try:
+            if self.data_svc is None:
+                return web.json_response({
+                    'success': False,
+                    'error': 'data_svc unavailable'
+                }, status=503)
+
             hours = int(request.query.get('hours', 24))
             operation_id_filter = request.query.get('operation_id', '').strip()
             raw_os = request.query.get('os_filter') or request.query.get('os')
@@ -925,14 +1309,14 @@ class BASTIONService:
             wazuh_agents_by_name = {}
             try:
                 await self._ensure_authenticated()
-                timeout = aiohttp.ClientTimeout(total=10)
-                connector = aiohttp.TCPConnector(ssl=self.verify_ssl)
+                timeout = aiohttp.ClientTimeout(total=self.TIMEOUT_AUTH)
 
-                async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+                async with self._wazuh_session() as session:
                     headers = {'Authorization': f'Bearer {self.token}'}
-                    async with session.get(f'{self.manager_url}/agents', headers=headers) as resp:
+                    async with session.get(f'{self.manager_url}/agents', headers=headers,
+                                           timeout=timeout) as resp:
                         if resp.status == 200:
-                            data = await resp.json()
+                            data = await _read_json(resp)
                             for wazuh_agent in data.get('data', {}).get('affected_items', []):
                                 agent_id = wazuh_agent.get('id')
                                 wazuh_agents_by_id[agent_id] = {
@@ -942,25 +1326,85 @@ class BASTIONService:
                                     'status': wazuh_agent.get('status'),
                                     'version': wazuh_agent.get('version')
                                 }
-                                name_key = (wazuh_agent.get('name') or '').lower()
+                                name_key = _norm_name(wazuh_agent.get('name'))
                                 if name_key: 
                                    wazuh_agents_by_name[name_key] = wazuh_agents_by_id[agent_id] 
                             self.log.info(f'[BASTION] Agents {len(wazuh_agents_by_id)}개 조회')
             except Exception as e:
                 self.log.warning(f'[BASTION] Agents 조회 실패: {e}')
 
-            # 2. Caldera Agents 조회
+            # 2. Caldera Agents / Operations 조회
+            # operations는 agent 루프 안에서 매번 다시 조회하지 않도록 한 번만 가져온다
             agents = await self.data_svc.locate('agents')
+            # 특정 작전만 볼 때는 전체 목록 대신 id 매칭으로 좁혀서 조회
+            if operation_id_filter:
+                all_operations = await self.data_svc.locate(
+                    'operations', match={'id': operation_id_filter})
+            else:
+                all_operations = await self.data_svc.locate('operations')
+            # 기준 시각은 핸들러당 한 번만 읽는다 (agent 루프 안 재호출 금지)
+            now = datetime.utcnow()
+            cutoff_time = now - timedelta(hours=hours)
+            alive_cutoff = now - timedelta(seconds=300)  # 5분 이내 keepalive면 alive
+
+            # 시간/ID 필터 결과와 PAW별 attack step 수는 agent마다 달라지지 않으므로
+            # agent 루프 밖에서 한 번만 계산한다 (이전에는 agent×op×link 재탐색)
+            relevant_ops = []
+            attack_steps_by_paw: Dict[str, int] = {}
+            for op in all_operations:
+                if operation_id_filter and op.id != operation_id_filter:
+                    continue
+                if op.start:
+                    op_start = _naive_utc(op.start)
+                    if isinstance(op_start, datetime) and op_start < cutoff_time:
+                        continue
+                relevant_ops.append(op)
+                for link in op.chain:
+                    paw = getattr(link, 'paw', None)
+                    if paw and link.finish:
+                        attack_steps_by_paw[paw] = attack_steps_by_paw.get(paw, 0) + 1
+
+            # Operation filter용: 해당 작전에 참여한 PAW 집합
+            filter_op_paws = None
+            if operation_id_filter:
+                filter_op_paws = set()
+                for op in all_operations:
+                    if op.id == operation_id_filter:
+                        filter_op_paws = {op_agent.paw for op_agent in op.agents}
+                        break
+
+            # correlate 결과는 agent와 무관하게 작전당 한 번이면 충분하므로
+            # agent 루프 밖에서 세마포어 제한 gather로 한꺼번에 수행하고
+            # PAW별 detected 카운트로 인덱싱해 둔다
+            # (이전에는 agent×op마다 correlate를 다시 호출했다)
+            detections_by_paw: Dict[str, int] = {}
+            if self._get_engine():
+                corr_ops = [op for op in relevant_ops if getattr(op, 'chain', None)]
+                if corr_ops:
+                    gathered = await asyncio.gather(
+                        *(self._bounded_correlate(op) for op in corr_ops),
+                        return_exceptions=True)
+                    for op, link_results in zip(corr_ops, gathered):
+                        if isinstance(link_results, Exception):
+                            self.log.debug(f'[BASTION] Operation {op.id} correlation 실패: {link_results}')
+                            continue
+                        for link_result in link_results:
+                            if link_result.get('detected', False):
+                                paw = link_result.get('paw')
+                                if paw:
+                                    detections_by_paw[paw] = detections_by_paw.get(paw, 0) + 1
 
             agents_data = []
+            # 탐지 조회 대기열: (agent_info, wazuh_agent_id) - 루프 뒤 _msearch로 일괄 처리
+            detection_queries: List[tuple] = []
             for agent in agents:
                 # Agent alive 상태 판단 (timezone 안전)
                 alive = False
                 if agent.last_seen:
                     try:
                         # timezone-aware datetime 처리
-                        last_seen = agent.last_seen.replace(tzinfo=None) if agent.last_seen.tzinfo else agent.last_seen
-                        alive = (datetime.utcnow() - last_seen).total_seconds() < 300  # 5분 이내
+                        last_seen = _naive_utc(agent.last_seen)
+                        alive = last_seen > alive_cutoff
                     except Exception as e:
                         self.log.debug(f'[BASTION] Agent {agent.paw} alive 상태 계산 실패: {e}')
                         alive = False
@@ -1012,7 +1456,7 @@ class BASTIONService:
 
                 # 2) Fallback: Caldera agent.host == Wazuh agent.name 이면 매핑
                 if not wazuh_agent_id and agent.host:
-                    host_key = (agent.host or '').lower()
+                    host_key = _norm_name(agent.host)
                     fallback = wazuh_agents_by_name.get(host_key)
                     if fallback:
                         wazuh_agent_id = fallback.get('id')
@@ -1040,133 +1484,15 @@ class BASTIONService:
                 agent_info['wazuh_agent'] = wazuh_agent if wazuh_agent else None
 
                 # 2. 각 Agent의 최근 Wazuh 탐지 조회 (매칭된 경우만)
+                # agent마다 개별 POST하지 않고 루프 종료 후 _msearch 1회로 일괄 조회
                 if wazuh_agent:
-                    query = {
-                        "query": {
-                            "bool": {
-                                "must": [
-                                    {"range": {"rule.level": {"gte": 5}}},
-                                    {"range": {"timestamp": {"gte": f"now-{hours}h"}}},
-                                    {"term": {"agent.id": wazuh_agent['id']}}
-                                ]
-                            }
-                        },
-                        "size": 10,
-                        "sort": [{"timestamp": {"order": "desc"}}],
-                        "_source": [
-                        "@timestamp", "timestamp",
-                        "rule.id", "rule.level", "rule.description",
-                        "data.mitre", "data.mitre.id", "data.mitre.tactic",
-                        "rule.mitre.technique", "rule.mitre.id",
-                        "agent.name", "agent.ip"
-                        ]
-                    }
+                    detection_queries.append((agent_info, wazuh_agent['id']))
 
-                    try:
-                        timeout = aiohttp.ClientTimeout(total=10)
-                        connector = aiohttp.TCPConnector(ssl=self.verify_ssl)
-
-                        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-                            auth = aiohttp.BasicAuth(self.indexer_username, self.indexer_password)
-                            async with session.post(
-                                f'{self.indexer_url}/wazuh-alerts-*/_search',
-                                json=query,
-                                auth=auth
-                            ) as resp:
-                                if resp.status == 200:
-                                    data = await resp.json()
-                                    alerts = data.get('hits', {}).get('hits', [])
-
-                                    for alert in alerts:
-                                        source = alert.get('_source', {})
-
-                                        # 1. 먼저 알림에서 직접 MITRE 데이터 확인
-                                        mitre_data = source.get('data', {}).get('mitre', {})
-                                        technique_id = mitre_data.get('id') if isinstance(mitre_data, dict) else None
-
-                                        # 2. MITRE 데이터가 없으면 규칙 ID 매핑 테이블 사용
-                                        if not technique_id:
-                                            rule_id = str(source.get('rule', {}).get('id', ''))
-                                            technique_id = self.RULE_MITRE_MAPPING.get(rule_id)
-                                        
-                                        ts = source.get('@timestamp') or source.get('timestamp')
-                                        agent_info['recent_detections'].append({
-                                            'timestamp': ts,
-                                            'rule_id': source.get('rule', {}).get('id'),
-                                            'rule_level': source.get('rule', {}).get('level'),
-                                            'description': source.get('rule', {}).get('description'),
-                                            'technique_id': technique_id
-                                        })
-
-                    except Exception as e:
-                        self.log.warning(f'[BASTION] Agent {agent.paw} 탐지 조회 실패: {e}')
-                        # 에러가 나도 agent 정보는 반환
-
-                # 1. Detections count - IntegrationEngine으로 매칭된 탐지만 카운트
-                matched_detections_count = 0
+                # 1. Detections count - 루프 밖에서 작전당 한 번 수행한 correlate 결과 사용
+                agent_info['detections_count'] = detections_by_paw.get(agent.paw, 0)
 
-                # IntegrationEngine을 사용해서 이 agent의 매칭된 탐지 카운트
-                if hasattr(self, 'integration_engine') and self.integration_engine:
-                    try:
-                        # 최근 operation들에 대해 correlation 수행
-                        all_operations = await self.data_svc.locate('operations')
-                        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-
-                        for op in all_operations:
-                            # operation_id_filter가 있으면 해당 operation만
-                            if operation_id_filter and op.id != operation_id_filter:
-                                continue
-
-                            # 시간 범위 체크
-                            if op.start:
-                                op_start = op.start.replace(tzinfo=None) if op.start.tzinfo else op.start
-                                if isinstance(op_start, datetime) and op_start < cutoff_time:
-                                    continue
-
-                            # IntegrationEngine correlation 수행
-                            try:
-                                link_results = await self.integration_engine.correlate(op)
-
-                                # 이 agent의 link 중 detected=True인 것만 카운트
-                                for link_result in link_results:
-                                    link_paw = link_result.get('paw')
-                                    detected = link_result.get('detected', False)
-
-                                    if link_paw == agent.paw and detected:
-                                        matched_detections_count += 1
-                            except Exception as corr_err:
-                                self.log.debug(f"[BASTION] Agent {agent.paw} correlation 실패: {corr_err}")
-                                continue
-                    except Exception as e:
-                        self.log.warning(f"[BASTION] Agent {agent.paw} 매칭 탐지 카운트 실패: {e}")
-
-                agent_info['detections_count'] = matched_detections_count
-
-                # 2. Attack steps count - operations에서 직접 계산
-                try:
-                    attack_steps_count = 0
-                    all_operations = await self.data_svc.locate('operations')
-                    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-
-                    for op in all_operations:
-                        # operation_id_filter가 있으면 해당 operation만
-                        if operation_id_filter and op.id != operation_id_filter:
-                            continue
-
-                        # 시간 범위 체크
-                        if op.start:
-                            op_start = op.start.replace(tzinfo=None) if op.start.tzinfo else op.start
-                            if isinstance(op_start, datetime) and op_start < cutoff_time:
-                                continue
-
-                        # 이 agent의 links 카운트
-                        for link in op.chain:
-                            if hasattr(link, 'paw') and link.paw == agent.paw and link.finish:
-                                attack_steps_count += 1
-
-                    agent_info['attack_steps_count'] = attack_steps_count
-                except Exception as e:
-                    self.log.warning(f'[BASTION] Agent {agent.paw} attack steps 계산 실패: {e}')
+                # 2. Attack steps count - 루프 밖에서 만든 PAW별 인덱스 사용
+                agent_info['attack_steps_count'] = attack_steps_by_paw.get(agent.paw, 0)
 
                 # OS Filter 적용
                 if os_filter:
@@ -1191,31 +1517,87 @@ class BASTIONService:
                         continue
 
                 # Operation Filter 적용 (해당 작전에 참여한 agent만 포함)
-                if operation_id_filter:
-                    all_operations = await self.data_svc.locate('operations')
-                    operation_match = False
-                    for op in all_operations:
-                        if op.id == operation_id_filter:
-                            # 이 작전의 agent 중에 현재 agent가 있는지 확인
-                            for op_agent in op.agents:
-                                if op_agent.paw == agent.paw:
-                                    operation_match = True
-                                    break
-                            break
-                    if not operation_match:
-                        continue
+                if filter_op_paws is not None and agent.paw not in filter_op_paws:
+                    continue
 
                 agents_data.append(agent_info)
 
+            # 2-2. 수집한 agent별 탐지 쿼리를 _msearch 한 번으로 실행
+            # (N개의 직렬 HTTP 왕복을 NDJSON 벌크 요청 1회로 축소)
+            if detection_queries:
+                msearch_lines = []
+                for _info, wazuh_id in detection_queries:
+                    msearch_lines.append('{"index":"wazuh-alerts-*"}')
+                    msearch_lines.append(_json_dumps({
+                        "query": {
+                            "bool": {
+                                "must": [
+                                    {"range": {"rule.level": {"gte": 5}}},
+                                    {"range": {"timestamp": {"gte": f"now-{hours}h"}}},
+                                    {"term": {"agent.id": wazuh_id}}
+                                ]
+                            }
+                        },
+                        "size": 10,
+                        "sort": [{"timestamp": {"order": "desc"}}],
+                        "_source": [
+                            "@timestamp", "timestamp",
+                            "rule.id", "rule.level", "rule.description",
+                            "data.mitre", "data.mitre.id", "data.mitre.tactic",
+                            "rule.mitre.technique", "rule.mitre.id",
+                            "agent.name", "agent.ip"
+                        ]
+                    }))
+                ndjson_body = '\n'.join(msearch_lines) + '\n'
+
+                try:
+                    timeout = aiohttp.ClientTimeout(total=self.TIMEOUT_QUERY)
+                    responses = []
+                    async with self._wazuh_session() as session:
+                        async with session.post(
+                            f'{self.indexer_url}/_msearch',
+                            data=ndjson_body,
+                            headers={'Content-Type': 'application/x-ndjson'},
+                            auth=self.indexer_auth,
+                            timeout=timeout
+                        ) as resp:
+                            if resp.status == 200:
+                                data = await _read_json(resp)
+                                responses = data.get('responses', [])
+                            else:
+                                self.log.warning(f'[BASTION] Agent 탐지 _msearch 실패 (HTTP {resp.status})')
+
+                    extract_technique = self._extract_technique
+                    for (agent_info, _wazuh_id), response in zip(detection_queries, responses):
+                        if not isinstance(response, dict):
+                            continue
+                        alerts = response.get('hits', {}).get('hits', [])
+                        recent_append = agent_info['recent_detections'].append
+                        for alert in alerts:
+                            source = alert.get('_source', {})
+                            rule = source.get('rule', {})
+                            technique_id = extract_technique(source)
+
+                            recent_append({
+                                'timestamp': source.get('@timestamp') or source.get('timestamp'),
+                                'rule_id': rule.get('id'),
+                                'rule_level': rule.get('level'),
+                                'description': rule.get('description'),
+                                'technique_id': technique_id
+                            })
+                except Exception as e:
+                    # 에러가 나도 agent 정보는 반환 (recent_detections만 비어 있음)
+                    self.log.warning(f'[BASTION] Agent 탐지 일괄 조회 실패: {e}')
+
             result = {
                 'success': True,
                 'total_agents': len(agents_data),
                 'agents': agents_data,
-                'query_time': datetime.utcnow().isoformat()
+                'query_time': _utc_now_iso()
             }
 
             self.log.info(f'[BASTION] Agents {len(agents_data)}개 조회 완료')
-            return web.json_response(result)
+            return web.json_response(result, dumps=_json_dumps)
 
         except Exception as e:
             self.log.error(f'[BASTION] Agents 조회 실패: {e}', exc_info=True)
@@ -1227,35 +1609,38 @@ class BASTIONService:
     async def health_check(self, request: web.Request) -> web.Response:
         """플러그인 및 Wazuh 연결 상태 확인"""
         try:
-            health = {
-                'plugin': 'healthy',
-                'wazuh_manager': 'unknown',
-                'wazuh_indexer': 'unknown',
-                'authenticated': self.is_authenticated,
-                'timestamp': datetime.utcnow().isoformat()
-            }
+            health = dict(self._HEALTH_TEMPLATE)
+            health['authenticated'] = self.is_authenticated
+            health['timestamp'] = _utc_now_iso()
 
             # Wazuh Manager 상태 확인
-            try:
-                await self._ensure_authenticated()
-                health['wazuh_manager'] = 'healthy'
-            except Exception as e:
-                health['wazuh_manager'] = f'unhealthy: {str(e)}'
+            async def _manager_status():
+                try:
+                    await self._ensure_authenticated()
+                    return 'healthy'
+                except Exception as e:
+                    return f'unhealthy: {str(e)}'
 
             # Wazuh Indexer 상태 확인
-            try:
-                timeout = aiohttp.ClientTimeout(total=5)
-                connector = aiohttp.TCPConnector(ssl=self.verify_ssl)
-                async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-                    auth = aiohttp.BasicAuth(self.indexer_username, self.indexer_password)
-                    async with session.get(f'{self.indexer_url}/_cluster/health', auth=auth) as resp:
-                        if resp.status == 200:
-                            cluster_health = await resp.json()
-                            health['wazuh_indexer'] = cluster_health.get('status', 'unknown')
-            except Exception as e:
-                health['wazuh_indexer'] = f'unhealthy: {str(e)}'
+            async def _indexer_status():
+                try:
+                    timeout = aiohttp.ClientTimeout(total=self.TIMEOUT_HEALTH)
+                    async with self._wazuh_session() as session:
+                        async with session.get(f'{self.indexer_url}/_cluster/health',
+                                               auth=self.indexer_auth, timeout=timeout) as resp:
+                            if resp.status == 200:
+                                cluster_health = await _read_json(resp)
+                                return cluster_health.get('status', 'unknown')
+                    return 'unknown'
+                except Exception as e:
+                    return f'unhealthy: {str(e)}'
 
-            return web.json_response(health)
+            # 서로 독립적인 서비스이므로 병렬로 확인 (지연 시간 = max, not sum)
+            health['wazuh_manager'], health['wazuh_indexer'] = await asyncio.gather(
+                _manager_status(), _indexer_status()
+            )
+
+            return web.json_response(health, dumps=_json_dumps)
 
         except Exception as e:
             self.log.error(f'[BASTION] 헬스체크 실패: {e}', exc_info=True)
@@ -1276,6 +1661,12 @@ class BASTIONService:
             search: 검색어 (선택사항)
         """
         try:
+            if self.data_svc is None:
+                return web.json_response({
+                    'success': False,
+                    'error': 'data_svc unavailable'
+                }, status=503)
+
             hours = int(request.query.get('hours', 24))
             min_level = int(request.query.get('min_level', 5))
             operation_id_filter = request.query.get('operation_id', '').strip()
@@ -1289,8 +1680,15 @@ class BASTIONService:
             )
 
             # 1. Operations 목록 조회 (Caldera)
-            all_operations = await self.data_svc.locate('operations')
+            # 특정 작전만 볼 때는 전체 목록 대신 id 매칭으로 좁혀서 조회
+            if operation_id_filter:
+                all_operations = await self.data_svc.locate(
+                    'operations', match={'id': operation_id_filter})
+            else:
+                all_operations = await self.data_svc.locate('operations')
             all_agents = await self.data_svc.locate('agents')  # 모든 agents 조회
+            # PAW -> agent 인덱스 (작전×PAW마다 전체 리스트를 선형 탐색하지 않도록)
+            agents_by_paw = {agent.paw: agent for agent in all_agents}
 
             cutoff_time = datetime.utcnow() - timedelta(hours=hours)
             operations_data = []
@@ -1312,7 +1710,7 @@ class BASTIONService:
                 op_start = None
 
                 if not operation_id_filter and op.start:
-                    op_start = op.start.replace(tzinfo=None) if op.start.tzinfo else op.start
+                    op_start = _naive_utc(op.start)
                     if isinstance(op_start, datetime) and op_start < cutoff_time:
                         include_by_time = False
 
@@ -1320,11 +1718,17 @@ class BASTIONService:
                     continue
 
                 # 3) 작전 실행 단계 추출
+                # (platform 유추용 executor 이름도 같은 패스에서 수집해
+                #  아래에서 op.chain을 PAW마다 다시 돌지 않도록 한다)
                 attack_steps = []
+                attack_steps_append = attack_steps.append
                 op_techniques = set()
+                executor_by_paw: Dict[str, str] = {}
 
                 for link in op.chain:
                     ability = link.ability
+                    if link.executor and link.paw not in executor_by_paw:
+                        executor_by_paw[link.paw] = link.executor.name
                     # link.finish가 datetime 객체인 경우 isoformat 변환, 문자열인 경우 그대로 사용
                     finish_time = None
                     if link.finish:
@@ -1333,7 +1737,7 @@ class BASTIONService:
                         else:
                             finish_time = link.finish.isoformat()
 
-                    attack_steps.append({
+                    attack_steps_append({
                         'ability_id': ability.ability_id,
                         'name': ability.name,
                         'tactic': ability.tactic,
@@ -1363,13 +1767,12 @@ class BASTIONService:
                 for paw in attack_step_paws:
                     found = False
 
-                    # 1. all_agents에서 찾기
-                    for agent in all_agents:
-                        if agent.paw == paw:
-                            agent_platforms[paw] = agent.platform
-                            agent_paws.append(paw)
-                            found = True
-                            break
+                    # 1. all_agents 인덱스에서 찾기
+                    agent = agents_by_paw.get(paw)
+                    if agent is not None:
+                        agent_platforms[paw] = agent.platform
+                        agent_paws.append(paw)
+                        found = True
 
                     # 2. op.agents에서 찾기 (all_agents에 없는 경우)
                     if not found:
@@ -1380,25 +1783,23 @@ class BASTIONService:
                                 found = True
                                 break
 
-                    # 3. executor로 platform 유추
+                    # 3. executor로 platform 유추 (체인 패스에서 수집해 둔 이름 사용)
                     if not found:
-                        for link in op.chain:
-                            if link.paw == paw and link.executor:
-                                executor_name = link.executor.name
-                                if executor_name in ['sh', 'bash']:
-                                    agent_platforms[paw] = 'linux'
-                                elif executor_name in ['cmd', 'psh', 'powershell']:
-                                    agent_platforms[paw] = 'windows'
-                                elif executor_name == 'osascript':
-                                    agent_platforms[paw] = 'darwin'
-                                else:
-                                    agent_platforms[paw] = 'linux'
-                                agent_paws.append(paw)
-                                self.log.warning(
-                                    f'[BASTION DEBUG] Inferred {paw} from executor '
-                                    f'{executor_name}: {agent_platforms[paw]}'
-                                )
-                                break
+                        executor_name = executor_by_paw.get(paw)
+                        if executor_name:
+                            if executor_name in ['sh', 'bash']:
+                                agent_platforms[paw] = 'linux'
+                            elif executor_name in ['cmd', 'psh', 'powershell']:
+                                agent_platforms[paw] = 'windows'
+                            elif executor_name == 'osascript':
+                                agent_platforms[paw] = 'darwin'
+                            else:
+                                agent_platforms[paw] = 'linux'
+                            agent_paws.append(paw)
+                            self.log.warning(
+                                f'[BASTION DEBUG] Inferred {paw} from executor '
+                                f'{executor_name}: {agent_platforms[paw]}'
+                            )
 
                     if not found and paw not in agent_platforms:
                         self.log.warning(
@@ -1461,14 +1862,10 @@ class BASTIONService:
 
             # 2. Wazuh Agent 정보 조회 (agent_id -> OS 매핑)
             wazuh_agent_os_map = {}
-            timeout = aiohttp.ClientTimeout(total=30)
 
-            async with aiohttp.ClientSession(
-                timeout=timeout,
-                connector=aiohttp.TCPConnector(ssl=self.verify_ssl)
-            ) as session:
+            async with self._wazuh_session() as session:
                 # Wazuh Manager API에서 JWT 토큰 획득
-                auth = aiohttp.BasicAuth(self.username, self.password)
+                auth = self.manager_auth
                 async with session.post(
                     f'{self.manager_url}/security/user/authenticate?raw=true',
                     auth=auth
@@ -1484,7 +1881,7 @@ class BASTIONService:
                             params={'limit': 500}
                         ) as agents_resp:
                             if agents_resp.status == 200:
-                                agents_data = await agents_resp.json()
+                                agents_data = await _read_json(agents_resp)
                                 for agent in agents_data.get('data', {}).get('affected_items', []):
                                     agent_id = agent.get('id')
                                     agent_os = agent.get('os', {}).get('platform', '').lower()
@@ -1502,26 +1899,20 @@ class BASTIONService:
 
                 for op in filtered_ops:
                     if op.start:
-                        # op.start가 문자열일 수 있으므로 datetime으로 변환
+                        # op.start가 문자열일 수 있으므로 datetime으로 변환 (캐시된 파서 사용)
                         if isinstance(op.start, str):
-                            try:
-                                op_start = datetime.fromisoformat(op.start.replace('Z', '+00:00')).replace(tzinfo=None)
-                            except Exception:
-                                op_start = None
+                            op_start = _parse_iso_utc_naive(op.start)
                         else:
-                            op_start = op.start.replace(tzinfo=None) if op.start.tzinfo else op.start
+                            op_start = _naive_utc(op.start)
                         if op_start:
                             op_start_times.append(op_start)
 
                     if op.finish:
-                        # op.finish가 문자열일 수 있으므로 datetime으로 변환
+                        # op.finish가 문자열일 수 있으므로 datetime으로 변환 (캐시된 파서 사용)
                         if isinstance(op.finish, str):
-                            try:
-                                op_end = datetime.fromisoformat(op.finish.replace('Z', '+00:00')).replace(tzinfo=None)
-                            except Exception:
-                                op_end = None
+                            op_end = _parse_iso_utc_naive(op.finish)
                         else:
-                            op_end = op.finish.replace(tzinfo=None) if op.finish.tzinfo else op.finish
+                            op_end = _naive_utc(op.finish)
                         if op_end:
                             op_end_times.append(op_end)
 
@@ -1568,7 +1959,9 @@ class BASTIONService:
                     }
                 },
                 "size": 1000,
-                "sort": [{"timestamp": {"order": "asc"}}],
+                # search_after 페이지네이션용 tie-breaker 포함 정렬
+                "sort": [{"timestamp": {"order": "asc"}}, {"_id": {"order": "asc"}}],
+                "track_total_hits": False,
                 "_source": [
                     "@timestamp", "timestamp", "rule.id", "rule.level", "rule.description",
                     "data.mitre", "data.mitre.id", "data.mitre.tactic",
@@ -1578,110 +1971,166 @@ class BASTIONService:
                 ]
             }
 
-            detected_techniques = set()
-            detection_events = []
+            # correlate() 결과는 op.id 기준으로 캐싱해서 같은 요청 안에서 재사용
+            # (KPI 계산 단계에서 동일한 Wazuh 쿼리를 반복하지 않도록)
+            correlate_results: Dict[str, List[dict]] = {}
 
-            async with aiohttp.ClientSession(
-                timeout=timeout,
-                connector=aiohttp.TCPConnector(ssl=self.verify_ssl)
-            ) as session:
-                auth = aiohttp.BasicAuth(self.indexer_username, self.indexer_password)
-                async with session.post(
-                    f'{self.indexer_url}/wazuh-alerts-*/_search',
-                    json=query,
-                    auth=auth
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        alerts = data.get('hits', {}).get('hits', [])
+            # correlate()는 인덱서 알림 조회와 독립적이므로 여기서 미리 스케줄해
+            # 페이지네이션 I/O와 겹쳐 실행한다 (wall-clock = max, not sum)
+            corr_ops = []
+            correlate_task = None
+            if self._get_engine() and filtered_ops:
+                for op in filtered_ops:
+                    # 체인이 비어 있으면 correlate 호출 자체를 생략 (코루틴 진입 비용 절약)
+                    if getattr(op, 'chain', None):
+                        corr_ops.append(op)
+                    else:
+                        correlate_results[getattr(op, 'id', '')] = []
+                if corr_ops:
+                    correlate_task = asyncio.gather(
+                        *(self._bounded_correlate(op) for op in corr_ops),
+                        return_exceptions=True
+                    )
 
-                        for alert in alerts:
-                            source = alert.get('_source', {})
-                            doc_id = alert.get('_id')
-                            ts = source.get('@timestamp') or source.get('timestamp')
-
-                            # MITRE 기법 추출
-                            mitre_data = source.get('data', {}).get('mitre', {})
-                            rule_mitre = source.get('rule', {}).get('mitre', {})
-                            technique_id = None
-                            tactic = None
-
-                            # 1. data.mitre.id 확인
-                            if isinstance(mitre_data, dict):
-                                technique_id = mitre_data.get('id')
-                                tactic = mitre_data.get('tactic', [])
-                                if isinstance(tactic, list) and tactic:
-                                    tactic = tactic[0]
-
-                            # 2. rule.mitre.id 확인 (배열인 경우 첫 번째 요소 추출)
-                            if not technique_id and isinstance(rule_mitre, dict):
-                                rule_mitre_id = rule_mitre.get('id')
-                                if isinstance(rule_mitre_id, list) and rule_mitre_id:
-                                    technique_id = rule_mitre_id[0]
-                                elif isinstance(rule_mitre_id, str):
-                                    technique_id = rule_mitre_id
-
-                                # tactic도 추출
-                                if not tactic:
-                                    rule_mitre_tactic = rule_mitre.get('tactic')
-                                    if isinstance(rule_mitre_tactic, list) and rule_mitre_tactic:
-                                        tactic = rule_mitre_tactic[0]
-                                    elif isinstance(rule_mitre_tactic, str):
-                                        tactic = rule_mitre_tactic
-
-                            # 3. 규칙 ID 매핑 테이블 사용
-                            if not technique_id:
-                                rule_id = str(source.get('rule', {}).get('id', ''))
-                                technique_id = self.RULE_MITRE_MAPPING.get(rule_id)
-
-                            # ⚠️ detected_techniques는 IntegrationEngine 매칭 후에만 추가
-                            # if technique_id:
-                            #     detected_techniques.add(technique_id)
-
-                            agent_id = source.get('agent', {}).get('id')
-                            agent_os = wazuh_agent_os_map.get(agent_id, 'unknown')
-
-                            # 상세 정보 필드 추출
-                            data_obj = source.get('data', {})
-                            audit_obj = data_obj.get('audit', {}) if isinstance(data_obj, dict) else {}
-
-                            detection_events.append({
-                                'doc_id': doc_id,
-                                'timestamp': ts,
-                                'rule_id': source.get('rule', {}).get('id'),
-                                'rule_level': source.get('rule', {}).get('level'),
-                                'description': source.get('rule', {}).get('description'),
-                                'agent_name': source.get('agent', {}).get('name'),
-                                'agent_id': agent_id,
-                                'agent_ip': source.get('agent', {}).get('ip'),
-                                'agent_os': agent_os,
-                                'technique_id': technique_id,
-                                'tactic': tactic,
-                                'match_status': 'unmatched',
-                                'attack_step_id': None,
-                                'match_source': 'wazuh',
-                                'opId': None,
-                                # 상세 정보 필드
-                                'location': source.get('location'),
-                                'full_log': source.get('full_log'),
-                                'audit_command': audit_obj.get('command'),
-                                'audit_exe': audit_obj.get('exe'),
-                                'audit_type': audit_obj.get('type'),
-                                'audit_cwd': audit_obj.get('cwd'),
-                                'srcip': data_obj.get('srcip') if isinstance(data_obj, dict) else None,
-                                'dstip': data_obj.get('dstip') if isinstance(data_obj, dict) else None,
-                            })
+            detection_events = []
+            # 핫루프 (최대 1000건) - bound method를 지역 변수로 호이스팅
+            detection_events_append = detection_events.append
+
+            # search_after 페이지네이션: 1000건 페이지를 이어 붙여 상한까지 수집
+            # (단일 쿼리 size 상한으로 탐지가 잘려 나가던 문제 해소)
+            page_size = query['size']
+            alerts = []
+            async with self._wazuh_session() as session:
+                auth = self.indexer_auth
+                search_url = f'{self.indexer_url}/wazuh-alerts-*/_search'
+                while len(alerts) < self.DASHBOARD_ALERT_LIMIT:
+                    async with session.post(search_url, data=_json_dumps(query),
+                                            headers=_JSON_HEADERS, auth=auth) as resp:
+                        if resp.status != 200:
+                            error_text = await resp.text()
+                            self.log.error(f'[BASTION] Indexer 쿼리 실패: {error_text}')
+                            break
+                        data = await _read_json(resp)
+                    page = data.get('hits', {}).get('hits', [])
+                    if not page:
+                        break
+                    alerts.extend(page)
+                    if len(page) < page_size:
+                        break
+                    last_sort = page[-1].get('sort')
+                    if not last_sort:
+                        break
+                    query['search_after'] = last_sort
+            query.pop('search_after', None)
+
+            # 상한 강제: 마지막 페이지가 상한을 넘겨도 메모리 사용량을 예측 가능하게 유지
+            if len(alerts) > self.DASHBOARD_ALERT_LIMIT:
+                self.log.warning(
+                    f'[BASTION] 알림 수집 상한 도달 - {self.DASHBOARD_ALERT_LIMIT}건으로 절단 '
+                    f'(수집={len(alerts)}건)'
+                )
+                del alerts[self.DASHBOARD_ALERT_LIMIT:]
+
+            for alert in alerts:
+                source = alert.get('_source', {})
+                doc_id = alert.get('_id')
+                ts = source.get('@timestamp') or source.get('timestamp')
+
+                # 반복 조회되는 중첩 dict는 한 번만 꺼낸다 (알림당 dict.get 수 회 절약)
+                rule_obj = source.get('rule') or {}
+                agent_obj = source.get('agent') or {}
+                data_obj = source.get('data')
+                if not isinstance(data_obj, dict):
+                    data_obj = {}
+
+                # MITRE 기법 추출
+                # Wazuh 알림의 표준 위치는 rule.mitre.id이므로 (>95%가 여기서 끝)
+                # 핫패스를 먼저 타고, 없을 때만 data.mitre → 매핑 테이블 순으로 폴백
+                rule_mitre = rule_obj.get('mitre', {})
+                technique_id = None
+                tactic = None
+
+                # 1. rule.mitre.id 확인 (배열인 경우 첫 번째 요소 추출)
+                if isinstance(rule_mitre, dict):
+                    rule_mitre_id = rule_mitre.get('id')
+                    if isinstance(rule_mitre_id, list) and rule_mitre_id:
+                        technique_id = rule_mitre_id[0]
+                    elif isinstance(rule_mitre_id, str):
+                        technique_id = rule_mitre_id
+
+                    rule_mitre_tactic = rule_mitre.get('tactic')
+                    if isinstance(rule_mitre_tactic, list) and rule_mitre_tactic:
+                        tactic = rule_mitre_tactic[0]
+                    elif isinstance(rule_mitre_tactic, str):
+                        tactic = rule_mitre_tactic
+
+                # 2. data.mitre.id 폴백
+                if not technique_id or not tactic:
+                    mitre_data = data_obj.get('mitre', {})
+                    if isinstance(mitre_data, dict):
+                        if not technique_id:
+                            technique_id = mitre_data.get('id')
+                        if not tactic:
+                            tactic = mitre_data.get('tactic', [])
+                            if isinstance(tactic, list) and tactic:
+                                tactic = tactic[0]
+
+                # 3. 규칙 ID 매핑 테이블 사용
+                if not technique_id:
+                    rule_id = str(rule_obj.get('id', ''))
+                    technique_id = self.RULE_MITRE_MAPPING.get(rule_id)
+
+                if technique_id:
+                    technique_id = _norm_tid(str(technique_id))
+
+                agent_id = agent_obj.get('id')
+                agent_os = wazuh_agent_os_map.get(agent_id, 'unknown')
+
+                # 상세 정보 필드 추출
+                audit_obj = data_obj.get('audit', {})
+                if not isinstance(audit_obj, dict):
+                    audit_obj = {}
+
+                detection_events_append({
+                    'doc_id': doc_id,
+                    'timestamp': ts,
+                    'rule_id': rule_obj.get('id'),
+                    'rule_level': rule_obj.get('level'),
+                    'description': rule_obj.get('description'),
+                    'agent_name': agent_obj.get('name'),
+                    'agent_id': agent_id,
+                    'agent_ip': agent_obj.get('ip'),
+                    'agent_os': agent_os,
+                    'technique_id': technique_id,
+                    'tactic': tactic,
+                    'match_status': 'unmatched',
+                    'attack_step_id': None,
+                    'match_source': 'wazuh',
+                    'opId': None,
+                    # 상세 정보 필드
+                    'location': source.get('location'),
+                    'full_log': source.get('full_log'),
+                    'audit_command': audit_obj.get('command'),
+                    'audit_exe': audit_obj.get('exe'),
+                    'audit_type': audit_obj.get('type'),
+                    'audit_cwd': audit_obj.get('cwd'),
+                    'srcip': data_obj.get('srcip'),
+                    'dstip': data_obj.get('dstip'),
+                })
+
+            # 원본 히트 리스트(최대 5000건의 _source dict)는 여기서부터 불필요 -
+            # 매칭/KPI 계산이 끝날 때까지 들고 있지 않도록 즉시 해제
+            del alerts
 
             # 3-A. IntegrationEngine 기반으로 detection_events 매칭 정보 반영
             self.log.info(
                 f"[BASTION DEBUG] 매칭 조건 확인: "
-                f"has_integration_engine={hasattr(self, 'integration_engine')}, "
-                f"integration_engine_exists={self.integration_engine is not None if hasattr(self, 'integration_engine') else False}, "
+                f"integration_engine_exists={self.integration_engine is not None}, "
                 f"filtered_ops_count={len(filtered_ops)}"
             )
 
             try:
-                if hasattr(self, "integration_engine") and self.integration_engine and filtered_ops:
+                if self.integration_engine and filtered_ops:
                     # 1) detection_events 인덱스 구축: (rule_id, agent_id) -> [(event_dt, ev), ...]
                     index_by_rule_agent: Dict[tuple, List[tuple]] = {}
 
@@ -1749,39 +2198,36 @@ class BASTIONService:
                         f"ops={len(filtered_ops)}, detections={len(detection_events)}"
                     )
 
+                    # 인덱서 알림 조회와 겹쳐 실행해 둔 correlate 결과 수거
+                    if correlate_task is not None:
+                        gathered = await correlate_task
+                        for op, res in zip(corr_ops, gathered):
+                            op_id = getattr(op, 'id', '')
+                            if isinstance(res, Exception):
+                                self.log.warning(f"[BASTION] correlate 실패 (op={op_id}): {res}")
+                                correlate_results[op_id] = []
+                            else:
+                                correlate_results[op_id] = res
+
                     for op in filtered_ops:
-                        try:
-                            self.log.info(
-                                f"[BASTION DEBUG] IntegrationEngine.correlate() 호출: "
-                                f"op={getattr(op, 'name', '')} ({getattr(op, 'id', '')})"
-                            )
-                            link_results = await self.integration_engine.correlate(op)
+                        link_results = correlate_results.get(getattr(op, 'id', '')) or []
+                        if not link_results:
+                            continue
 
-                            if not link_results:
-                                self.log.info(f"[BASTION DEBUG] No link results for operation")
-                                continue
+                        self.log.info(
+                            f"[BASTION DEBUG] IntegrationEngine 결과: {len(link_results)}개 링크 "
+                            f"(op={getattr(op, 'name', '')})"
+                        )
 
+                        # 🔍 각 링크의 매칭 결과 출력
+                        for lr in link_results:
                             self.log.info(
-                                f"[BASTION DEBUG] IntegrationEngine 결과: {len(link_results)}개 링크"
+                                f"[BASTION DEBUG] Link: {lr.get('ability_name')} "
+                                f"(technique={lr.get('technique_id')}), "
+                                f"detected={lr.get('detected')}, "
+                                f"matches={lr.get('match_count')}"
                             )
 
-                            # 🔍 각 링크의 매칭 결과 출력
-                            for lr in link_results:
-                                self.log.info(
-                                    f"[BASTION DEBUG] Link: {lr.get('ability_name')} "
-                                    f"(technique={lr.get('technique_id')}), "
-                                    f"detected={lr.get('detected')}, "
-                                    f"matches={lr.get('match_count')}"
-                                )
-
-                        except Exception as ce:
-                            self.log.warning(
-                                f"[BASTION] correlate 실패 (op={getattr(op, 'id', '')}): {ce}"
-                            )
-                            import traceback
-                            traceback.print_exc()
-                            continue
-
                         op_name = getattr(op, "name", "")
                         op_id = getattr(op, "id", "")
                         op_label = f"{op_name} ({op_id})" if (op_name or op_id) else op_id
@@ -1791,12 +2237,6 @@ class BASTIONService:
                                 link_id = lr.get("link_id")
                                 matches_list = lr.get("matches", [])
 
-                                # ✅ detected=True인 링크의 technique_id를 detected_techniques에 추가
-                                if lr.get("detected", False):
-                                    tech_id = lr.get("technique_id")
-                                    if tech_id:
-                                        detected_techniques.add(tech_id)
-
                                 # 🔍 매칭 시작 디버그 (조건 없이 항상 출력)
                                 if matches_list:
                                     self.log.info(
@@ -1917,7 +2357,6 @@ class BASTIONService:
                     )
             except Exception as e:
                 self.log.warning(f"[BASTION] dashboard correlation 반영 실패: {e}")
-                import traceback
                 traceback.print_exc()
 
             # 🔻 매칭된 탐지 이벤트 카운트 (KPI용)
@@ -1957,11 +2396,19 @@ class BASTIONService:
             total_attack_links = total_attack_steps  # 이미 계산된 전체 링크 개수
 
             # detected_links 계산: IntegrationEngine에서 detected=True인 링크 개수
+            # 위 매칭 단계에서 캐싱한 correlate 결과를 재사용 (Wazuh 재쿼리 방지)
             detected_links = 0
-            if hasattr(self, 'integration_engine') and self.integration_engine and filtered_ops:
+            if self.integration_engine and filtered_ops:
                 for op in filtered_ops:
                     try:
-                        link_results = await self.integration_engine.correlate(op)
+                        op_key = getattr(op, 'id', '')
+                        link_results = correlate_results.get(op_key)
+                        if link_results is None:
+                            if not getattr(op, 'chain', None):
+                                link_results = []
+                            else:
+                                link_results = await self.integration_engine.correlate(op)
+                            correlate_results[op_key] = link_results
                         for lr in link_results:
                             if lr.get('detected', False):
                                 detected_links += 1
@@ -1998,39 +2445,49 @@ class BASTIONService:
                 security_grade = 'F'
 
             # MTTD 계산 (Mean Time To Detection)
+            # 기법별 탐지 시각 인덱스를 한 번만 구축 - 스텝×이벤트 전체 교차 비교 대신
+            # 스텝마다 해당 기법의 탐지 시각 리스트만 순회 (이벤트 타임스탬프 파싱도 1회로 축소)
+            detections_by_technique: Dict[str, List[datetime]] = {}
+            for event in detection_events:
+                event_technique = event.get('technique_id')
+                if not event_technique:
+                    continue
+                try:
+                    detection_time = date_parser.parse(event['timestamp']).replace(tzinfo=None)
+                except Exception:
+                    continue
+                detections_by_technique.setdefault(event_technique, []).append(detection_time)
+
             mttd_seconds = 0
             mttd_count = 0
             for op in operations_data:
-                if op.get('attack_steps'):
-                    for step in op['attack_steps']:
-                        step_time = step.get('timestamp')
-                        if step_time:
-                            step_technique = step.get('technique_id')
-                            for event in detection_events:
-                                if event.get('technique_id') == step_technique:
-                                    try:
-                                        attack_time = date_parser.parse(step_time).replace(tzinfo=None)
-                                        detection_time = date_parser.parse(
-                                            event['timestamp']
-                                        ).replace(tzinfo=None)
-                                        time_diff = (detection_time - attack_time).total_seconds()
-                                        if time_diff >= 0:
-                                            mttd_seconds += time_diff
-                                            mttd_count += 1
-                                    except Exception:
-                                        pass
+                for step in op.get('attack_steps') or []:
+                    step_time = step.get('timestamp')
+                    detection_times = detections_by_technique.get(step.get('technique_id'))
+                    if not step_time or not detection_times:
+                        continue
+                    try:
+                        attack_time = date_parser.parse(step_time).replace(tzinfo=None)
+                    except Exception:
+                        continue
+                    for detection_time in detection_times:
+                        time_diff = (detection_time - attack_time).total_seconds()
+                        if time_diff >= 0:
+                            mttd_seconds += time_diff
+                            mttd_count += 1
 
             mttd_minutes = round(mttd_seconds / 60 / mttd_count, 1) if mttd_count > 0 else 0
 
             # Critical Gaps (시뮬레이션했지만 탐지 안된 공격 횟수)
             critical_gaps = total_attack_links - detected_links
 
-            # Tactic Coverage
-            all_tactics = set()
-            for op in operations_data:
-                for step in op.get('attack_steps', []):
-                    if step.get('tactic'):
-                        all_tactics.add(step['tactic'])
+            # Tactic Coverage (단일 패스 set-comprehension으로 고유 tactic 집계)
+            all_tactics = {
+                step['tactic']
+                for op in operations_data
+                for step in op.get('attack_steps', [])
+                if step.get('tactic')
+            }
 
             tactic_coverage = len(all_tactics)
 
@@ -2079,14 +2536,14 @@ class BASTIONService:
                 },
                 'operations': operations_data,
                 'detection_events': detection_events[:400],  # 매칭된 이벤트만 최근 400건
-                'query_time': datetime.utcnow().isoformat()
+                'query_time': _utc_now_iso()
             }
 
             self.log.info(
                 f'[BASTION] 대시보드 요약 생성 완료 (작전: {len(operations_data)}, '
                 f'탐지: {len(detection_events)}, Score: {security_score}/{security_grade})'
             )
-            return web.json_response(result)
+            return web.json_response(result, dumps=_json_dumps)
 
         except Exception as e:
             self.log.error(f'[BASTION] 대시보드 요약 실패: {e}', exc_info=True)
@@ -2103,8 +2560,39 @@ class BASTIONService:
         - Caldera 작전 링크에서 시뮬레이션된 technique 통계 수집
         - Wazuh Indexer에서 alert 조회해서 탐지된 technique 카운트
         """
+        future = None
+        cache_key = None
         try:
+            if self.data_svc is None:
+                return web.json_response({
+                    'error': 'data_svc unavailable',
+                    'techniques': [],
+                    'tactics': [],
+                }, status=503)
+
             hours = int(request.query.get('hours', 24))
+
+            # 동일 파라미터 폴링은 TTL 내에서 캐시된 결과 재사용
+            cache_key = (hours, self.indexer_url)
+            cached = self._cache_get(self._coverage_cache, cache_key, self.COVERAGE_CACHE_TTL)
+            if cached is not None:
+                return web.json_response(cached, dumps=_json_dumps)
+
+            # single-flight: 동일 파라미터 계산이 이미 진행 중이면 그 결과를 공유
+            inflight = self._coverage_inflight.get(cache_key)
+            if inflight is not None:
+                payload = await asyncio.shield(inflight)
+                if payload is None:
+                    return web.json_response({
+                        'error': 'coverage computation failed',
+                        'techniques': [],
+                        'tactics': [],
+                    }, status=500)
+                return web.json_response(payload, dumps=_json_dumps)
+
+            future = asyncio.get_event_loop().create_future()
+            self._coverage_inflight[cache_key] = future
+
             self.log.info(f'[BASTION] Technique 커버리지 분석: 최근 {hours}시간')
 
             now_utc = datetime.utcnow()
@@ -2114,18 +2602,15 @@ class BASTIONService:
             technique_stats: Dict[str, Dict[str, Any]] = {}
 
             operations = await self.data_svc.locate('operations')
+            # 시간 필터를 통과하고 체인이 있는 작전 목록 (2단계 correlation에서 재사용)
+            recent_ops: List[Any] = []
             for op in operations:
                 if not op.start:
                     continue
 
                 # timezone-aware → naive 로 통일해서 비교
-                op_start = op.start
-                if isinstance(op_start, datetime):
-                    if op_start.tzinfo:
-                        op_start = op_start.replace(tzinfo=None)
-                else:
-                    # 문자열인 경우는 그냥 통과 (필터 못 씀)
-                    pass
+                # 문자열인 경우는 그냥 통과 (필터 못 씀)
+                op_start = _naive_utc(op.start)
 
                 if isinstance(op_start, datetime) and op_start < cutoff_time:
                     continue
@@ -2133,6 +2618,7 @@ class BASTIONService:
                 if not hasattr(op, 'chain') or not op.chain:
                     continue
 
+                recent_ops.append(op)
                 for link in op.chain:
                     ability = getattr(link, 'ability', None)
                     if not ability or not ability.technique_id:
@@ -2150,37 +2636,29 @@ class BASTIONService:
                     technique_stats[tech_id]['simulated'] += 1
 
             # 2. IntegrationEngine을 사용해서 매칭된 탐지만 집계
-            if technique_stats and hasattr(self, 'integration_engine') and self.integration_engine:
+            if technique_stats and self.integration_engine:
                 try:
-                    # 시간 범위 내의 operation들에 대해 correlation 실행
-                    for op in operations:
-                        if not op.start:
+                    # 1단계에서 걸러둔 작전 목록 재사용 (시간 필터 중복 수행 금지)
+                    # 작전별 correlate는 독립적이므로 세마포어 상한 안에서 동시 실행
+                    gathered = await asyncio.gather(
+                        *(self._bounded_correlate(op) for op in recent_ops),
+                        return_exceptions=True
+                    )
+                    for op, link_results in zip(recent_ops, gathered):
+                        if isinstance(link_results, Exception):
+                            self.log.debug(
+                                f"[BASTION] Operation {op.id} correlation 실패: {link_results}")
                             continue
 
-                        op_start = op.start
-                        if isinstance(op_start, datetime):
-                            if op_start.tzinfo:
-                                op_start = op_start.replace(tzinfo=None)
+                        # 매칭된 이벤트에서 technique ID 추출
+                        for link_result in link_results:
+                            if link_result.get('detected', False):
+                                # technique_id 추출
+                                tech_id = link_result.get('technique_id')
 
-                        if isinstance(op_start, datetime) and op_start < cutoff_time:
-                            continue
-
-                        # IntegrationEngine으로 매칭 수행
-                        try:
-                            link_results = await self.integration_engine.correlate(op)
-
-                            # 매칭된 이벤트에서 technique ID 추출
-                            for link_result in link_results:
-                                if link_result.get('detected', False):
-                                    # technique_id 추출
-                                    tech_id = link_result.get('technique_id')
-
-                                    if tech_id and tech_id in technique_stats:
-                                        # 탐지된 공격 1건으로 카운트 (여러 alert가 매칭되어도 1건)
-                                        technique_stats[tech_id]["detected"] += 1
-                        except Exception as corr_err:
-                            self.log.debug(f"[BASTION] Operation {op.id} correlation 실패: {corr_err}")
-                            continue
+                                if tech_id and tech_id in technique_stats:
+                                    # 탐지된 공격 1건으로 카운트 (여러 alert가 매칭되어도 1건)
+                                    technique_stats[tech_id]["detected"] += 1
 
                 except Exception as e:
                     self.log.warning(f"[BASTION] IntegrationEngine을 이용한 탐지 집계 실패: {e}")
@@ -2231,23 +2709,21 @@ class BASTIONService:
                 detected = t["total_detected"]
                 t["coverage"] = round((detected / total * 100.0) if total > 0 else 0.0, 1)
 
+            total_simulated = sum(t["simulated"] for t in techniques)
+            total_detected = sum(t["detected"] for t in techniques)
             summary = {
                 "total_techniques": len(techniques),
-                "total_simulated": sum(t["simulated"] for t in techniques),
-                "total_detected": sum(t["detected"] for t in techniques),
+                "total_simulated": total_simulated,
+                "total_detected": total_detected,
                 "overall_detection_rate": round(
-                    (
-                        sum(t["detected"] for t in techniques)
-                        / sum(t["simulated"] for t in techniques)
-                        * 100.0
-                    )
-                    if techniques and sum(t["simulated"] for t in techniques) > 0
+                    (total_detected / total_simulated * 100.0)
+                    if total_simulated > 0
                     else 0.0,
                     1,
                 ),
             }
 
-            return web.json_response({
+            payload = {
                 "techniques": techniques,
                 "tactics": list(tactics.values()),
                 "summary": summary,
@@ -2256,7 +2732,11 @@ class BASTIONService:
                     "from": cutoff_time.isoformat(),
                     "to": now_utc.isoformat(),
                 },
-            })
+            }
+            self._cache_put(self._coverage_cache, cache_key, payload, self.COVERAGE_CACHE_MAX)
+            if not future.done():
+                future.set_result(payload)
+            return web.json_response(payload, dumps=_json_dumps)
 
         except Exception as e:
             self.log.error(f"[BASTION] Technique 커버리지 조회 실패: {e}", exc_info=True)
@@ -2271,6 +2751,12 @@ class BASTIONService:
                     "overall_detection_rate": 0.0,
                 },
             }, status=500)
+        finally:
+            # 실패 포함 어떤 경로로든 inflight 등록 해제 (대기자는 None을 실패로 처리)
+            if future is not None:
+                self._coverage_inflight.pop(cache_key, None)
+                if not future.done():
+                    future.set_result(None)
 
 
     async def continuous_monitoring(self):
@@ -1,28 +1,130 @@
+import concurrent.futures
+import copy
 import os
+import time
+from collections import OrderedDict
 import yaml
 import asyncio
+import functools
+import json
+import logging
+import operator
+import traceback
 from datetime import datetime, timedelta, timezone
 
+log = logging.getLogger('integration_engine')
+
+# libyaml 바인딩이 있으면 C 파서 사용 (순수 파이썬 SafeLoader 대비 수 배 빠름)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 try:
     from opensearchpy import OpenSearch
 except Exception as e:
-    import logging
-    logging.getLogger('integration_engine').debug(f'[IntegrationEngine] OpenSearch import 실패: {e}')
+    log.debug(f'[IntegrationEngine] OpenSearch import 실패: {e}')
     OpenSearch = None
 
 try:
     from elasticsearch import Elasticsearch
 except Exception as e:
-    import logging
-    logging.getLogger('integration_engine').debug(f'[IntegrationEngine] Elasticsearch import 실패: {e}')
+    log.debug(f'[IntegrationEngine] Elasticsearch import 실패: {e}')
     Elasticsearch = None
 
+# C 확장 ISO8601 파서 (있으면 fromisoformat 대비 수십 배 빠름, 없어도 동작)
+try:
+    from ciso8601 import parse_datetime as _fast_parse
+except Exception:
+    _fast_parse = None
+
 
 CONFIG_CANDIDATES = [
     os.path.join(os.path.dirname(__file__), 'conf', 'default.yml'),
     os.path.join(os.getcwd(), 'conf', 'default.yml')
 ]
 
+# 파싱된 설정 캐시: path -> ((mtime, size), parsed dict)
+# 엔진을 재생성해도 (mtime, size)가 같으면 YAML 재파싱을 건너뛴다
+_YAML_CACHE: dict = {}
+
+# 접속 파라미터별 클라이언트 캐시 (커넥션 풀 재사용)
+_CLIENT_CACHE: dict = {}
+
+# 동기 클라이언트 검색 전용 스레드 풀 - 기본 executor(최대 40 스레드)를
+# 뺏지 않으면서 동시 검색 수를 커넥션 풀 크기 수준으로 제한
+_SEARCH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=16, thread_name_prefix='bastion-search')
+
+# _search 결과 캐시 설정: 같은 기법이 겹치는 시간창으로 반복 조회되는 것을
+# 흡수한다. TTL을 짧게 잡아 진행 중인 작전의 새 알림을 놓치지 않게 한다.
+_SEARCH_CACHE_MAX = 512
+_SEARCH_CACHE_TTL = 30  # seconds
+
+
+# link 타임스탬프 속성 우선순위: finish > start > decide
+_LINK_TS_ATTRS = ('finish', 'start', 'decide')
+_LINK_TS_GETTER = operator.attrgetter(*_LINK_TS_ATTRS)
+
+
+def _link_timestamp(link):
+    """link에서 우선순위대로 첫 번째 truthy 타임스탬프 반환 (없으면 None)
+
+    attrgetter 한 번으로 세 속성을 모두 가져와 getattr 3연쇄보다 싸게 처리한다.
+    """
+    try:
+        values = _LINK_TS_GETTER(link)
+    except AttributeError:
+        values = tuple(getattr(link, attr, None) for attr in _LINK_TS_ATTRS)
+    for value in values:
+        if value:
+            return value
+    return None
+
+
+# Constant-shape fallback payloads - copied on use instead of rebuilt
+# key-by-key in every error path
+_EMPTY_EVENT = {
+    'link_id': '',
+    'ability_name': '',
+    'technique_id': '',
+    'executed_at': None,
+    'timestamp': None,
+    'command': '',
+    'pid': None,
+}
+
+_EMPTY_LINK_RESULT = {
+    'link_id': '',
+    'paw': '',
+    'ability_name': '',
+    'technique_id': '',
+    'executed_at': None,
+    'detected': False,
+    'match_count': 0,
+    'pid': None,
+    'pid_match_count': 0,
+    'confidence': 0.0,
+    'matches': None,  # replaced with a fresh list on copy
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_to_utc(s: str):
+    """ISO8601 문자열 -> timezone-aware UTC datetime | None
+
+    같은 타임스탬프 문자열이 링크/알림에 걸쳐 반복 파싱되므로 결과를
+    lru_cache로 재사용한다 (datetime은 불변이라 공유해도 안전).
+    ciso8601이 설치돼 있으면 C 파서를 먼저 태운다.
+    """
+    try:
+        if _fast_parse is not None:
+            dt = _fast_parse(s)
+        else:
+            dt = datetime.fromisoformat(s[:-1] + '+00:00' if s.endswith('Z') else s)
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    except Exception as e:
+        # timestamp 변환 실패는 흔한 일이므로 디버그 레벨만 로깅
+        log.debug(f'[IntegrationEngine] datetime 변환 실패: {s}, error: {e}')
+        return None
+
 
 def _to_dt(value):
     """value(str/int/float/datetime) -> timezone-aware UTC datetime | None"""
@@ -33,17 +135,7 @@ def _to_dt(value):
     if isinstance(value, (int, float)):
         return datetime.fromtimestamp(float(value), tz=timezone.utc)
     if isinstance(value, str):
-        s = value.strip()
-        if s.endswith('Z'):
-            s = s[:-1] + '+00:00'
-        try:
-            dt = datetime.fromisoformat(s)
-            return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
-        except Exception as e:
-            # timestamp 변환 실패는 흔한 일이므로 디버그 레벨만 로깅
-            import logging
-            logging.getLogger('integration_engine').debug(f'[IntegrationEngine] datetime 변환 실패: {s}, error: {e}')
-            return None
+        return _iso_to_utc(value.strip())
     return None
 
 
@@ -78,7 +170,12 @@ class IntegrationEngine:
 
         self.wazuh = self.config.get('wazuh', {})
         self.match = self.config.get('match', {})
-        self.client = self._build_client()
+
+        # 클라이언트 생성은 첫 검색 시점으로 미룬다 (엔진만 만들고 검색하지
+        # 않는 경로의 기동 비용 절약). 라이브러리 부재만 즉시 실패시킨다
+        if OpenSearch is None and Elasticsearch is None:
+            raise RuntimeError('Neither opensearch-py nor elasticsearch client is installed')
+        self._client = None
 
         # Debugging mode
         self.debug = self.config.get('debug', False)
@@ -92,14 +189,45 @@ class IntegrationEngine:
                     self.technique_to_rules[technique_id] = []
                 self.technique_to_rules[technique_id].append(str(rule_id))
 
+        # 검색 결과 LRU 캐시: (technique_id, 시간버킷) -> (monotonic, 요약 결과)
+        self._search_cache: OrderedDict = OrderedDict()
+
+        # _build_query의 정적 부분(필드 목록, size, 시간창)은 config에만 의존하므로
+        # 링크마다 재구성하지 않고 엔진 생성 시 한 번만 계산해 둔다
+        self._query_window_sec = int(self.match.get('time_window_sec', self.config.get('time_window_sec', 7200)))
+        self._query_size = int(self.match.get('max_alerts', 200))
+        mitre_fields = self.match.get('mitre_fields') or [
+            'data.mitre.id',
+            'rule.mitre.id',
+            'mitre.id',
+            'rule.mitre.technique',
+        ]
+        term_fields = []
+        for f in mitre_fields:
+            term_fields.append(f)
+            # Try .keyword variation (for analyzed fields)
+            if not f.endswith('.keyword'):
+                term_fields.append(f + '.keyword')
+        self._query_term_fields = tuple(term_fields)
+        self._query_message_fields = tuple(self.match.get('message_fields') or [])
+
     # ------------------
     # Config / Client
     # ------------------
     def _load_settings(self) -> dict:
         for path in CONFIG_CANDIDATES:
-            if os.path.exists(path):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stamp = (st.st_mtime, st.st_size)
+            cached = _YAML_CACHE.get(path)
+            if cached is None or cached[0] != stamp:
                 with open(path, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f) or {}
+                    cached = (stamp, yaml.load(f, Loader=_YAML_LOADER) or {})
+                _YAML_CACHE[path] = cached
+            # 호출자가 overrides로 update()하므로 캐시 원본은 deepcopy로 보호
+            return copy.deepcopy(cached[1])
         return {}
 
     def _build_client(self):
@@ -112,12 +240,18 @@ class IntegrationEngine:
         password = self.wazuh.get('password') or self.config.get('password')
 
         # Default kwargs
+        # maxsize: urllib3 pool defaults to 10 connections, which serializes
+        # concurrent searches (gathered correlate calls run in executor threads);
+        # http_compress: gzip large alert pages over the wire
+        pool_maxsize = int(self.wazuh.get('pool_maxsize', self.config.get('pool_maxsize', 32)))
         kwargs = {
             'verify_certs': verify,
             'ssl_show_warn': False,
             'timeout': 30,
             'max_retries': 2,
             'retry_on_timeout': True,
+            'maxsize': pool_maxsize,
+            'http_compress': True,
         }
 
         # Host definition: ES prefers scheme included in hosts, OS also accepts it
@@ -140,10 +274,26 @@ class IntegrationEngine:
             kwargs['basic_auth'] = (username, password)
 
         if OpenSearch is not None:
-            return OpenSearch(**kwargs)
-        if Elasticsearch is not None:
-            return Elasticsearch(**kwargs)
-        raise RuntimeError('Neither opensearch-py nor elasticsearch client is installed')
+            cls = OpenSearch
+        elif Elasticsearch is not None:
+            cls = Elasticsearch
+        else:
+            raise RuntimeError('Neither opensearch-py nor elasticsearch client is installed')
+
+        # 접속 파라미터가 같으면 클라이언트(와 그 urllib3 풀)를 전역 공유
+        # (cls를 키에 포함해 클라이언트 구현이 바뀌면 캐시도 갈라진다)
+        cache_key = (cls, host, port, scheme, verify, username, password, pool_maxsize)
+        client = _CLIENT_CACHE.get(cache_key)
+        if client is None:
+            client = cls(**kwargs)
+            _CLIENT_CACHE[cache_key] = client
+        return client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
 
     # ------------------
     # Operation Events
@@ -154,7 +304,7 @@ class IntegrationEngine:
             ability = getattr(link, 'ability', None)
             technique_id = getattr(ability, 'technique_id', None) if ability else None
             ability_name = getattr(ability, 'name', '') if ability else ''
-            ts_dt = getattr(link, 'finish', None) or getattr(link, 'start', None) or getattr(link, 'decide', None)
+            ts_dt = _link_timestamp(link)
             command = getattr(link, 'command', None)
             pid = getattr(link, 'pid', None)
 
@@ -167,8 +317,7 @@ class IntegrationEngine:
                     elif isinstance(ts_dt, (int, float)):
                         timestamp = float(ts_dt)
                 except Exception as e:
-                    import logging
-                    logging.getLogger('integration_engine').debug(f'[IntegrationEngine] timestamp 변환 실패: {ts_dt}, error: {e}')
+                    log.debug(f'[IntegrationEngine] timestamp 변환 실패: {ts_dt}, error: {e}')
                     timestamp = None
 
             return {
@@ -182,15 +331,9 @@ class IntegrationEngine:
             }
         except Exception as e:
             # Return minimal information
-            return {
-                'link_id': str(getattr(link, 'id', '')) if link else '',
-                'ability_name': '',
-                'technique_id': '',
-                'executed_at': None,
-                'timestamp': None,
-                'command': '',
-                'pid': None,
-            }
+            event = dict(_EMPTY_EVENT)
+            event['link_id'] = str(getattr(link, 'id', '')) if link else ''
+            return event
 
     async def collect_operation_events(self, operation) -> list[dict]:
         events = []
@@ -203,24 +346,29 @@ class IntegrationEngine:
     # Indexer Querying (Improved)
     # ------------------
     def _build_query(self, technique_id: str, center_ts: float) -> dict:
-        """Improved query builder - wider time window and diverse field search (safe processing)"""
+        """Improved query builder - wider time window and diverse field search (safe processing)
+
+        Static parts (field lists, size, time window) are precomputed in
+        __init__; only technique_id and the time range vary per query.
+        """
         try:
             # Time window setup (default: 7200s = 2 hours)
-            window_sec = int(self.match.get('time_window_sec', self.config.get('time_window_sec', 7200)))
+            window_sec = self._query_window_sec
 
-            # Convert Unix timestamp to UTC datetime (safely)
+            # Window bounds straight from the epoch - skips the center
+            # datetime and the two timedelta allocations per query
             try:
-                center = datetime.fromtimestamp(center_ts, tz=timezone.utc)
+                gte = datetime.fromtimestamp(center_ts - window_sec, tz=timezone.utc).isoformat()
+                lte = datetime.fromtimestamp(center_ts + window_sec, tz=timezone.utc).isoformat()
             except (ValueError, OSError, OverflowError):
                 # Use current time if timestamp is invalid
-                center = datetime.now(tz=timezone.utc)
-
-            gte = (center - timedelta(seconds=window_sec)).isoformat()
-            lte = (center + timedelta(seconds=window_sec)).isoformat()
+                center_ts = datetime.now(tz=timezone.utc).timestamp()
+                gte = datetime.fromtimestamp(center_ts - window_sec, tz=timezone.utc).isoformat()
+                lte = datetime.fromtimestamp(center_ts + window_sec, tz=timezone.utc).isoformat()
 
             if self.debug:
                 print(f"[DEBUG] Time window: {window_sec} seconds (±{window_sec/3600:.1f} hours)")
-                print(f"[DEBUG] Center timestamp: {center_ts} → {center}")
+                print(f"[DEBUG] Center timestamp: {center_ts}")
                 print(f"[DEBUG] Search range: {gte} to {lte}")
         except Exception as time_err:
             if self.debug:
@@ -229,30 +377,12 @@ class IntegrationEngine:
             gte = "now-2h"
             lte = "now+2h"
 
-        # MITRE fields - add more variations
-        mitre_fields = self.match.get('mitre_fields') or [
-            'data.mitre.id',
-            'rule.mitre.id', 
-            'mitre.id',
-            'rule.mitre.technique',
-        ]
-        
-        message_fields = self.match.get('message_fields') or []
-
         # Configure 'should' conditions
-        should = []
-        
-        # 1. Term query for each MITRE field (exact match)
-        for f in mitre_fields:
-            # Search with original field name
-            should.append({'term': {f: technique_id}})
-            
-            # Try .keyword variation (for analyzed fields)
-            if not f.endswith('.keyword'):
-                should.append({'term': {f + '.keyword': technique_id}})
-        
+        # 1. Term query for each MITRE field (exact match, .keyword variants included)
+        should = [{'term': {f: technique_id}} for f in self._query_term_fields]
+
         # 2. Match phrase for message fields
-        for f in message_fields:
+        for f in self._query_message_fields:
             should.append({'match_phrase': {f: technique_id}})
 
         # 3. Search using Rule ID mapping (for alerts without MITRE fields)
@@ -275,7 +405,21 @@ class IntegrationEngine:
         ]
 
         query = {
-            'size': int(self.match.get('max_alerts', 200)),
+            'size': self._query_size,
+            # Only the leaf fields _summarize_hit reads - skipping the rest of
+            # the alert document cuts payload size and JSON decode time
+            '_source': [
+                '@timestamp', 'timestamp',
+                'rule.id', 'rule.level', 'rule.description', 'rule.mitre',
+                'data.mitre',
+                'data.audit.type', 'data.audit.exe',
+                'data.audit.pid', 'data.audit.ppid',
+                'data.win.eventdata.processId', 'data.win.eventdata.ProcessId',
+                'data.win.eventdata.parentProcessId', 'data.win.eventdata.ParentProcessId',
+                'agent.id', 'agent.name',
+                'mitre.id', 'mitre.tactic',
+                'message', 'full_log',
+            ],
             'query': {
                 'bool': {
                     'filter': [
@@ -298,8 +442,7 @@ class IntegrationEngine:
         
         # Print query in debug mode
         if self.debug:
-            import json
-            print(f"\n[DEBUG] Query for {technique_id} at {center}:")
+            print(f"\n[DEBUG] Query for {technique_id} at {center_ts}:")
             print(f"Time range: {gte} ~ {lte}")
             print(json.dumps(query, indent=2))
         
@@ -317,51 +460,42 @@ class IntegrationEngine:
                     return val
         return None
 
-    def _extract_pid(self, data: dict) -> str | None:
-        """Wazuh 알림에서 PID 추출 (Linux auditd / Windows Sysmon)"""
+    def _extract_pids(self, data: dict) -> tuple[str | None, str | None]:
+        """Wazuh 알림에서 (PID, PPID)를 한 번에 추출 (Linux auditd / Windows Sysmon)
+
+        알림당 audit/win dict 탐색을 한 번만 수행한다.
+        """
         if not isinstance(data, dict):
-            return None
+            return (None, None)
 
-        # Linux auditd: data.audit.pid
+        pid = ppid = None
+
+        # Linux auditd: data.audit.pid / data.audit.ppid
         audit = data.get('audit')
         if isinstance(audit, dict):
-            pid = audit.get('pid')
-            if pid:
-                return str(pid)
-
-        # Windows Sysmon: data.win.eventdata.processId
-        win = data.get('win')
-        if isinstance(win, dict):
-            eventdata = win.get('eventdata')
-            if isinstance(eventdata, dict):
-                pid = eventdata.get('processId') or eventdata.get('ProcessId')
-                if pid:
-                    return str(pid)
+            pid = audit.get('pid') or None
+            ppid = audit.get('ppid') or None
+
+        # Windows Sysmon: data.win.eventdata.processId / parentProcessId
+        if pid is None or ppid is None:
+            win = data.get('win')
+            if isinstance(win, dict):
+                eventdata = win.get('eventdata')
+                if isinstance(eventdata, dict):
+                    if pid is None:
+                        pid = eventdata.get('processId') or eventdata.get('ProcessId')
+                    if ppid is None:
+                        ppid = eventdata.get('parentProcessId') or eventdata.get('ParentProcessId')
+
+        return (str(pid) if pid else None, str(ppid) if ppid else None)
 
-        return None
+    def _extract_pid(self, data: dict) -> str | None:
+        """Wazuh 알림에서 PID 추출 (Linux auditd / Windows Sysmon)"""
+        return self._extract_pids(data)[0]
 
     def _extract_ppid(self, data: dict) -> str | None:
         """Wazuh 알림에서 PPID(Parent PID) 추출 (Linux auditd / Windows Sysmon)"""
-        if not isinstance(data, dict):
-            return None
-
-        # Linux auditd: data.audit.ppid
-        audit = data.get('audit')
-        if isinstance(audit, dict):
-            ppid = audit.get('ppid')
-            if ppid:
-                return str(ppid)
-
-        # Windows Sysmon: data.win.eventdata.parentProcessId
-        win = data.get('win')
-        if isinstance(win, dict):
-            eventdata = win.get('eventdata')
-            if isinstance(eventdata, dict):
-                ppid = eventdata.get('parentProcessId') or eventdata.get('ParentProcessId')
-                if ppid:
-                    return str(ppid)
-
-        return None
+        return self._extract_pids(data)[1]
 
     def _match_pid(self, link_pid, alert_pid: str | None, alert_ppid: str | None) -> tuple[bool, str | None]:
         """PID 매칭 확인 및 매칭 타입 반환
@@ -452,6 +586,14 @@ class IntegrationEngine:
             if not isinstance(agent, dict):
                 agent = {}
 
+            # Handle data.audit once (type/exe fields below)
+            audit = data.get('audit') if isinstance(data, dict) else None
+            if not isinstance(audit, dict):
+                audit = {}
+
+            # PID/PPID in one data walk
+            pid, ppid = self._extract_pids(data)
+
             # timestamp priority: @timestamp > timestamp
             ts = src.get('@timestamp') or src.get('timestamp')
 
@@ -504,12 +646,12 @@ class IntegrationEngine:
 
                 # Others
                 'description': description,
-                'data.audit.type': data.get('audit', {}).get('type') if isinstance(data, dict) and isinstance(data.get('audit'), dict) else None,
-                'data.audit.exe': data.get('audit', {}).get('exe') if isinstance(data, dict) and isinstance(data.get('audit'), dict) else None,
+                'data.audit.type': audit.get('type'),
+                'data.audit.exe': audit.get('exe'),
 
                 # PID 필드 추출 (Linux auditd / Windows Sysmon)
-                'pid': self._extract_pid(data),
-                'ppid': self._extract_ppid(data),
+                'pid': pid,
+                'ppid': ppid,
             }
         except Exception as e:
             if self.debug:
@@ -535,6 +677,19 @@ class IntegrationEngine:
                 print(f"[DEBUG] No client available")
             return []
 
+        # 같은 기법이 겹치는 시간창(±window)으로 반복 조회되면 캐시로 흡수
+        # (버킷 = 창 너비 단위의 타임스탬프 구간)
+        window_sec = self._query_window_sec
+        bucket = int(ts_epoch // (window_sec * 2)) if window_sec > 0 else 0
+        cache_key = (technique_id, bucket)
+        entry = self._search_cache.get(cache_key)
+        if entry is not None:
+            if (time.monotonic() - entry[0]) < _SEARCH_CACHE_TTL:
+                self._search_cache.move_to_end(cache_key)
+                # 호출부의 PID 필터링이 match dict를 변형하므로 복사본 반환
+                return [dict(m) for m in entry[1]]
+            del self._search_cache[cache_key]
+
         index = self.wazuh.get('index_pattern') or self.config.get('index', 'wazuh-alerts-4.x-*')
 
         try:
@@ -576,32 +731,89 @@ class IntegrationEngine:
                     except Exception as e:
                         print(f"[DEBUG] Sample hit 출력 실패: {e}")
 
-            # Process results (safely)
-            results = []
-            for h in hits:
-                try:
-                    summarized = self._summarize_hit(h)
-                    if summarized:
-                        results.append(summarized)
-                        if self.debug and len(results) == 1:
-                            print(f"[DEBUG] First summarized result:")
-                            print(f"  - rule.id: {summarized.get('rule.id')}")
-                            print(f"  - agent.id: {summarized.get('agent.id')}")
-                            print(f"  - agent.name: {summarized.get('agent.name')}")
-                except Exception as sum_err:
-                    if self.debug:
-                        print(f"[DEBUG] Failed to summarize hit: {sum_err}")
-                    continue
+            # Process results - _summarize_hit swallows its own exceptions
+            # (returns {}), so a walrus listcomp with a truthiness filter is
+            # the lowest-overhead form of this loop
+            results = [s for h in hits if (s := self._summarize_hit(h))]
+
+            if self.debug and results:
+                first = results[0]
+                print(f"[DEBUG] First summarized result:")
+                print(f"  - rule.id: {first.get('rule.id')}")
+                print(f"  - agent.id: {first.get('agent.id')}")
+                print(f"  - agent.name: {first.get('agent.name')}")
+
+            # 캐시에는 변형되지 않은 원본 복사본을 보관 (LRU 512개 상한)
+            self._search_cache[cache_key] = (time.monotonic(), [dict(m) for m in results])
+            if len(self._search_cache) > _SEARCH_CACHE_MAX:
+                self._search_cache.popitem(last=False)
 
             return results
 
         except Exception as e:
             if self.debug:
                 print(f"[DEBUG] Search failed: {e}")
-            import traceback
             traceback.print_exc()
             return []
 
+    def _msearch(self, specs: list[tuple]) -> list[list[dict]] | None:
+        """Batch all per-link queries into a single _msearch round-trip.
+
+        specs is a list of (technique_id, ts_epoch) tuples, one per link.
+        Returns summarized match lists aligned with specs, or None when the
+        batch call is unavailable or fails so the caller can fall back to
+        per-link _search.
+        """
+        if not self.client or not hasattr(self.client, 'msearch'):
+            return None
+
+        index = self.wazuh.get('index_pattern') or self.config.get('index', 'wazuh-alerts-4.x-*')
+        body = []
+        order = []  # deduped spec per msearch entry
+        positions: dict[tuple, list[int]] = {}  # spec -> specs indices
+        for i, spec in enumerate(specs):
+            technique_id, ts_epoch = spec
+            if not technique_id or not isinstance(ts_epoch, (int, float)):
+                continue
+            # Identical (technique, timestamp) windows collapse into one
+            # query; duplicates get a copy of the same result set
+            if spec in positions:
+                positions[spec].append(i)
+                continue
+            try:
+                query = self._build_query(technique_id, ts_epoch)
+            except Exception:
+                continue
+            positions[spec] = [i]
+            body.append({'index': index})
+            body.append(query)
+            order.append(spec)
+
+        results: list[list[dict]] = [[] for _ in specs]
+        if not body:
+            return results
+
+        try:
+            resp = self.client.msearch(body=body)
+            responses = (resp or {}).get('responses') or []
+            if len(responses) != len(order):
+                return None
+        except Exception as e:
+            if self.debug:
+                print(f"[DEBUG] _msearch failed, falling back to per-link search: {e}")
+            return None
+
+        for spec, item in zip(order, responses):
+            hits = (item or {}).get('hits', {}).get('hits', []) if isinstance(item, dict) else []
+            summarized = [s for h in hits if (s := self._summarize_hit(h))]
+            first, *rest = positions[spec]
+            results[first] = summarized
+            for i in rest:
+                # PID filtering mutates matches per link, so duplicates
+                # must not share the dicts
+                results[i] = [dict(m) for m in summarized]
+        return results
+
     async def correlate(self, operation) -> list[dict]:
         """Correlate Wazuh alerts for each link in the operation (safe processing)"""
         try:
@@ -619,15 +831,56 @@ class IntegrationEngine:
                 print(f"[DEBUG] Operation: {getattr(operation, 'name', 'Unknown')}")
                 print(f"[DEBUG] Total links: {len(chain)}")
 
+            # Batch every per-link query into one _msearch round-trip;
+            # prefetched stays None when the batch path is unavailable.
+            # link_dts keeps the parsed datetimes so the main loop below does
+            # not re-run _to_dt/.timestamp() per link
+            specs = []
+            link_dts = []
+            for link in chain:
+                ability = getattr(link, 'ability', None)
+                technique_id = getattr(ability, 'technique_id', None) if ability else None
+                ts_dt = _to_dt(_link_timestamp(link))
+                link_dts.append(ts_dt)
+                specs.append((technique_id, ts_dt.timestamp() if ts_dt else None))
+            # Fail fast: no searchable link means no round-trip at all
+            if any(t and isinstance(ts, (int, float)) for t, ts in specs):
+                prefetched = await loop.run_in_executor(_SEARCH_EXECUTOR, self._msearch, specs)
+            else:
+                prefetched = [[] for _ in specs]
+
+            if prefetched is None:
+                # msearch unavailable: fan the individual searches out on the
+                # executor pool concurrently instead of one await per link
+                futures = [
+                    loop.run_in_executor(_SEARCH_EXECUTOR, self._search, t, ts)
+                    if t and isinstance(ts, (int, float)) else None
+                    for t, ts in specs
+                ]
+                gathered = iter(await asyncio.gather(
+                    *(f for f in futures if f is not None),
+                    return_exceptions=True
+                ))
+                prefetched = []
+                for f in futures:
+                    if f is None:
+                        prefetched.append([])
+                    else:
+                        res = next(gathered)
+                        if isinstance(res, Exception):
+                            log.debug(f'[IntegrationEngine] fallback search 실패: {res}')
+                            res = []
+                        prefetched.append(res)
+
             for idx, link in enumerate(chain, 1):
                 try:
                     ability = getattr(link, 'ability', None)
                     technique_id = getattr(ability, 'technique_id', None) if ability else None
                     ability_name = getattr(ability, 'name', '') if ability else ''
 
-                    ts_raw = getattr(link, 'finish', None) or getattr(link, 'start', None) or getattr(link, 'decide', None)
-                    ts_dt = _to_dt(ts_raw)
-                    ts_epoch = ts_dt.timestamp() if ts_dt else None
+                    # Reuse the conversions done while building specs
+                    ts_dt = link_dts[idx - 1]
+                    ts_epoch = specs[idx - 1][1]
 
                     # PID 추출 (Caldera 공격 로그)
                     link_pid = getattr(link, 'pid', None)
@@ -642,7 +895,7 @@ class IntegrationEngine:
                     matches = []
                     if technique_id and ts_epoch:
                         try:
-                            matches = await loop.run_in_executor(None, self._search, technique_id, ts_epoch)
+                            matches = prefetched[idx - 1]
 
                             # PID 매칭 적용
                             if matches and link_pid:
@@ -717,19 +970,11 @@ class IntegrationEngine:
                     if self.debug:
                         print(f"[DEBUG] Error processing link {idx}: {link_err}")
                     # Add minimal info even on error
-                    results.append({
-                        'link_id': str(getattr(link, 'id', '')) if link else f'error_{idx}',
-                        'paw': str(getattr(link, 'paw', '')) if link else '',
-                        'ability_name': '',
-                        'technique_id': '',
-                        'executed_at': None,
-                        'detected': False,
-                        'match_count': 0,
-                        'pid': None,
-                        'pid_match_count': 0,
-                        'confidence': 0.0,
-                        'matches': []
-                    })
+                    fallback = dict(_EMPTY_LINK_RESULT)
+                    fallback['link_id'] = str(getattr(link, 'id', '')) if link else f'error_{idx}'
+                    fallback['paw'] = str(getattr(link, 'paw', '')) if link else ''
+                    fallback['matches'] = []
+                    results.append(fallback)
 
             if self.debug:
                 detected_count = sum(1 for r in results if r.get('detected', False))
@@ -743,6 +988,5 @@ class IntegrationEngine:
         except Exception as e:
             if self.debug:
                 print(f"[DEBUG] Critical error in correlate: {e}")
-            import traceback
             traceback.print_exc()
             return []
\ No newline at end of file
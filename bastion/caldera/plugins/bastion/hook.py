@@ -53,6 +53,10 @@ async def enable(services):
         # Register REST API endpoints
         app = app_svc.application
 
+        # Pre-resolve the service into the app once at setup so request-time
+        # code can read app['bastion_svc'] instead of re-resolving services
+        app['bastion_svc'] = bastion_svc
+
         # Alerts endpoint
         app.router.add_route('GET', '/plugin/bastion/alerts',
                             bastion_svc.get_recent_alerts)
@@ -96,30 +100,47 @@ async def enable(services):
         app.router.add_route('POST', '/api/discover/search',
                             bastion_svc.discover_search)
 
+        # Close the pooled Wazuh session cleanly on server shutdown
+        async def _close_bastion_svc(_app):
+            await bastion_svc.close()
+
+        app.on_cleanup.append(_close_bastion_svc)
+
         # Static file serving (CSS, JS, images) - currently unused
         # app.router.add_static('/bastion/static',
         #                      'plugins/bastion/static/',
         #                      append_version=True)
 
         log.info('[BASTION] REST API endpoint registration complete')
-        log.info('[BASTION] Available endpoints:')
-        log.info('  - GET  /plugin/bastion/alerts')
-        log.info('  - POST /plugin/bastion/correlate')
-        log.info('  - GET  /plugin/bastion/detection_report')
-        log.info('  - POST /plugin/bastion/adaptive_operation')
-        log.info('  - GET  /plugin/bastion/health')
-        log.info('  - GET  /plugin/bastion/agents')
-        log.info('  - GET  /plugin/bastion/dashboard')
-        log.info('  - GET  /plugin/bastion/dashboard/techniques (NEW - Week 11)')
-        log.info('  - GET  /plugin/bastion/es/indices (NEW - Discover)')
-        log.info('  - POST /plugin/bastion/es/search  (NEW - Discover)')
-        log.info('  - GET  /api/discover/indices (NEW - Discover MVP)')
-        log.info('  - POST /api/discover/search  (NEW - Discover MVP)')
-        log.info(f'  - GUI: http://localhost:8888{address}')
+        # Per-endpoint dump only when debugging - the list is static and the
+        # formatting/IO cost is wasted at normal log levels
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('[BASTION] Available endpoints:')
+            for route in (
+                ('GET', '/plugin/bastion/alerts'),
+                ('POST', '/plugin/bastion/correlate'),
+                ('GET', '/plugin/bastion/detection_report'),
+                ('POST', '/plugin/bastion/adaptive_operation'),
+                ('GET', '/plugin/bastion/health'),
+                ('GET', '/plugin/bastion/agents'),
+                ('GET', '/plugin/bastion/dashboard'),
+                ('GET', '/plugin/bastion/dashboard/techniques'),
+                ('GET', '/plugin/bastion/es/indices'),
+                ('POST', '/plugin/bastion/es/search'),
+                ('GET', '/api/discover/indices'),
+                ('POST', '/api/discover/search'),
+            ):
+                log.debug('  - %-4s %s', *route)
+            log.debug('  - GUI: http://localhost:8888%s', address)
 
         # Start Wazuh authentication in background
         import asyncio
 
+        # The event loop is created by the Caldera server long before plugins
+        # load, so a plugin cannot swap in uvloop here - just record which
+        # implementation is serving us for performance triage
+        log.debug(f'[BASTION] Event loop implementation: {type(asyncio.get_event_loop()).__module__}')
+
         async def authenticate_wazuh():
             try:
                 await bastion_svc.authenticate()